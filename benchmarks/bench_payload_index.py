@@ -0,0 +1,127 @@
+"""Microbenchmark for extract_metadata_from_payload against saved run payloads.
+
+Compares the single-pass field index with the previous implementation, which
+re-walked the whole payload for every field lookup, and checks that both
+produce identical metadata.
+
+Usage:
+    python benchmarks/bench_payload_index.py [--runs outputs] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrape_sam import (  # noqa: E402
+    _iterate_nested,
+    extract_metadata_from_payload,
+    extract_organization_levels,
+    format_code_list,
+    format_contacts,
+    format_place_of_performance,
+    stringify,
+)
+
+
+def _legacy_find_first(obj: Any, keys: Iterable[str]) -> Any:
+    lowered = [key.lower() for key in keys]
+    for result in _iterate_nested(obj):
+        if isinstance(result, dict):
+            for key, value in result.items():
+                if key.lower() in lowered:
+                    return value
+    return None
+
+
+def legacy_extract_metadata_from_payload(payload: Dict[str, Any]) -> Dict[str, str]:
+    find = _legacy_find_first
+    data: Dict[str, str] = {}
+    data["title"] = stringify(find(payload, ["title", "opportunityTitle", "noticeTitle"]))
+    data["description"] = stringify(find(payload, ["description", "summary", "noticeSummary"]))
+    data["published_date"] = stringify(
+        find(payload, ["publishDate", "publicationDate", "postedDate", "publish_date"])
+    )
+    data["response_date"] = stringify(
+        find(payload, ["responseDate", "responseDueDate", "closeDate", "responseCloseDate"])
+    )
+    data["set_aside"] = stringify(find(payload, ["typeOfSetAside", "setAside", "set_aside"]))
+    data["naics"] = format_code_list(find(payload, ["naics", "naicsCodes", "naics_code"]))
+    data["psc"] = format_code_list(
+        find(payload, ["psc", "pscCodes", "psc_code"]), code_keys=("psc", "pscCode", "code")
+    )
+    data["place_of_performance"] = format_place_of_performance(
+        find(payload, ["placeOfPerformance", "place_of_performance"])
+    )
+    data["contact_information"] = format_contacts(
+        find(payload, ["contacts", "pointsOfContact", "primaryContact", "contact"])
+    )
+    hierarchy = find(payload, ["organizationHierarchy", "organizationHierarchyDisplay"])
+    department, sub_tier, office = extract_organization_levels(hierarchy)
+    if not department:
+        department = stringify(find(payload, ["department", "agency", "agencyName"]))
+    if not sub_tier:
+        sub_tier = stringify(find(payload, ["subTier", "subtier", "subAgency"]))
+    if not office:
+        office = stringify(find(payload, ["office", "officeName"]))
+    data["department"] = department
+    data["sub_tier"] = sub_tier
+    data["office"] = office
+    return {key: value for key, value in data.items() if value}
+
+
+def load_payloads(runs_dir: Path) -> List[Dict[str, Any]]:
+    payloads: List[Dict[str, Any]] = []
+    for manifest_path in sorted(runs_dir.glob("*/manifests/*.json")):
+        with manifest_path.open("r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        payloads.extend(manifest.get("opportunities", []))
+    for journal_path in sorted(runs_dir.glob("*/manifests/*.jsonl")):
+        with journal_path.open("r", encoding="utf-8") as handle:
+            payloads.extend(json.loads(line) for line in handle if line.strip())
+    return payloads
+
+
+def _time(func, payloads: List[Dict[str, Any]], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for payload in payloads:
+            func(payload)
+    return time.perf_counter() - start
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=Path, default=Path("outputs"), help="Directory holding run outputs")
+    parser.add_argument("--repeat", type=int, default=200, help="Passes over the payload set")
+    args = parser.parse_args(argv)
+
+    payloads = load_payloads(args.runs)
+    if not payloads:
+        print(f"No manifest payloads found under {args.runs}")
+        return 1
+
+    for payload in payloads:
+        if extract_metadata_from_payload(payload) != legacy_extract_metadata_from_payload(payload):
+            print(f"Mismatch for {payload.get('opportunity_id')}")
+            return 1
+
+    legacy = _time(legacy_extract_metadata_from_payload, payloads, args.repeat)
+    indexed = _time(extract_metadata_from_payload, payloads, args.repeat)
+    calls = len(payloads) * args.repeat
+
+    print(f"payloads: {len(payloads)} x {args.repeat} passes")
+    print(f"legacy  : {legacy * 1e6 / calls:8.1f} us/payload")
+    print(f"indexed : {indexed * 1e6 / calls:8.1f} us/payload")
+    print(f"speedup : {legacy / indexed:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
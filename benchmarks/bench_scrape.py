@@ -0,0 +1,241 @@
+"""Offline scraper throughput benchmark over recorded HTTP fixtures.
+
+Replays a fixture directory (recorded with ``pipeline.py scrape
+--record-fixtures DIR`` or synthesized with ``--synthesize``) through
+OpportunityScraper at several concurrency settings and reports
+opportunities/s, attachment bytes/s and peak RSS. Each setting runs in its
+own process so peak RSS is measured per setting.
+
+Usage:
+    python benchmarks/bench_scrape.py --fixtures fixtures/sam [--concurrency 1 2 4 8]
+    python benchmarks/bench_scrape.py --fixtures /tmp/synthetic --synthesize 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrape_sam import (  # noqa: E402
+    ATTACHMENT_DOWNLOAD_URL,
+    ATTACHMENTS_LIST_URL,
+    OPPORTUNITY_DETAIL_URL,
+    ORGANIZATION_DETAIL_URL,
+    SESSION_DIR,
+    OpportunityScraper,
+    PlaywrightSessionManager,
+    ScrapeConfig,
+)
+from utils.http_fixtures import FixtureStore, fixture_key  # noqa: E402
+
+
+OPPORTUNITY_KEY = re.compile(r"^GET .*/opps/v2/opportunities/([A-Za-z0-9]+)\?")
+
+
+def synthesize_fixtures(
+    root: Path, *, count: int, attachments: int, attachment_bytes: int
+) -> None:
+    """Write a synthetic fixture set shaped like real SAM.gov responses."""
+
+    store = FixtureStore(root)
+    json_headers = [("content-type", "application/json")]
+
+    def put_json(url: str, payload: Dict[str, Any]) -> None:
+        store.put(
+            fixture_key("GET", url),
+            status=200,
+            headers=json_headers,
+            body=json.dumps(payload).encode("utf-8"),
+        )
+
+    put_json(
+        ORGANIZATION_DETAIL_URL.format(organization_id="100000000", nonce=0),
+        {"_embedded": [{"org": {"fullParentPathName": "DEPARTMENT.SUB TIER.OFFICE"}}]},
+    )
+    for number in range(count):
+        opportunity_id = f"bench{number:06d}"
+        resources = [
+            {
+                "name": f"attachment-{index}.pdf",
+                "resourceId": f"{opportunity_id}r{index}",
+                "attachmentId": f"{opportunity_id}a{index}",
+                "mimeType": ".pdf",
+                "size": attachment_bytes,
+            }
+            for index in range(attachments)
+        ]
+        put_json(
+            OPPORTUNITY_DETAIL_URL.format(opportunity_id=opportunity_id, nonce=0),
+            {
+                "data2": {
+                    "title": f"Benchmark opportunity {number}",
+                    "organizationId": "100000000",
+                    "naics": [{"code": ["541511"]}],
+                },
+                "description": [{"body": f"<p>Synthetic description {number}</p>"}],
+                "modifiedDate": "2024-01-01T00:00:00Z",
+            },
+        )
+        put_json(
+            ATTACHMENTS_LIST_URL.format(opportunity_id=opportunity_id, nonce=0),
+            {"_embedded": {"opportunityAttachmentList": [{"attachments": resources}]}},
+        )
+        if not resources:
+            continue
+
+        location = f"https://fixtures.invalid/{opportunity_id}.zip"
+        put_json(
+            ATTACHMENT_DOWNLOAD_URL.format(
+                opportunity_id=opportunity_id,
+                resource_ids=",".join(item["resourceId"] for item in resources),
+                nonce=0,
+            ),
+            {"location": location},
+        )
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as bundle:
+            for item in resources:
+                # Unique content per file so the content store cannot dedupe it away.
+                seed = f"{item['resourceId']}\n".encode("utf-8")
+                body = (seed * (attachment_bytes // len(seed) + 1))[:attachment_bytes]
+                bundle.writestr(item["name"], body)
+        store.put(
+            fixture_key("GET", location),
+            status=200,
+            headers=[("content-type", "application/zip")],
+            body=archive.getvalue(),
+        )
+    store.save()
+
+
+def fixture_opportunity_ids(root: Path) -> List[str]:
+    ids = []
+    for key in FixtureStore(root).keys():
+        match = OPPORTUNITY_KEY.match(key)
+        if match:
+            ids.append(match.group(1))
+    return sorted(set(ids))
+
+
+def run_one(fixtures: Path, concurrency: int) -> Dict[str, Any]:
+    """Scrape every recorded opportunity once and return throughput figures."""
+
+    logging.basicConfig(level=logging.ERROR)
+    ids = fixture_opportunity_ids(fixtures)
+    with tempfile.TemporaryDirectory(prefix="bench-scrape-") as temp:
+        output_dir = Path(temp)
+        input_csv = output_dir / "input.csv"
+        with input_csv.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["sam-url"])
+            writer.writerows([f"https://sam.gov/opp/{item}/view"] for item in ids)
+
+        config = ScrapeConfig(
+            input_csv=input_csv,
+            output_dir=output_dir,
+            concurrency=concurrency,
+            use_cache=False,
+            full_refresh=True,
+            request_rate=1000.0,
+            replay_fixtures=fixtures,
+        )
+        scraper = OpportunityScraper(
+            config=config, session_manager=PlaywrightSessionManager(SESSION_DIR)
+        )
+        start = time.perf_counter()
+        results = scraper.run()
+        elapsed = time.perf_counter() - start
+
+        stored_bytes = sum(
+            path.stat().st_size
+            for path in (output_dir / "blobs").rglob("*")
+            if path.is_file()
+        )
+
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss_kb //= 1024
+    return {
+        "concurrency": concurrency,
+        "opportunities": len(results),
+        "errors": sum(1 for result in results if result.status != "success"),
+        "seconds": elapsed,
+        "bytes": stored_bytes,
+        "peak_rss_kb": peak_rss_kb,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, required=True, help="Recorded fixture directory")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to measure")
+    parser.add_argument("--synthesize", type=int, default=0, help="Write N synthetic opportunities into --fixtures first")
+    parser.add_argument("--attachments", type=int, default=3, help="Attachments per synthetic opportunity")
+    parser.add_argument("--attachment-kb", type=int, default=256, help="Size of each synthetic attachment in KiB")
+    parser.add_argument("--run-one", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_one is not None:
+        print(json.dumps(run_one(args.fixtures, args.run_one)))
+        return 0
+
+    if args.synthesize:
+        synthesize_fixtures(
+            args.fixtures,
+            count=args.synthesize,
+            attachments=args.attachments,
+            attachment_bytes=args.attachment_kb * 1024,
+        )
+
+    if not fixture_opportunity_ids(args.fixtures):
+        print(f"No recorded opportunities found under {args.fixtures}")
+        return 1
+
+    print(f"{'workers':>7} {'opps':>6} {'errors':>6} {'opps/s':>8} {'MiB/s':>8} {'peak RSS MiB':>12}")
+    failed = False
+    for concurrency in args.concurrency:
+        completed = subprocess.run(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "--fixtures",
+                str(args.fixtures),
+                "--run-one",
+                str(concurrency),
+            ],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        )
+        if completed.returncode != 0:
+            print(completed.stderr)
+            return completed.returncode
+        stats = json.loads(completed.stdout.strip().splitlines()[-1])
+        seconds = max(stats["seconds"], 1e-9)
+        print(
+            f"{concurrency:>7} {stats['opportunities']:>6} {stats['errors']:>6} "
+            f"{stats['opportunities'] / seconds:>8.1f} "
+            f"{stats['bytes'] / seconds / 2**20:>8.1f} "
+            f"{stats['peak_rss_kb'] / 1024:>12.1f}"
+        )
+        failed = failed or stats["errors"] > 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,401 @@
+"""Discover SAM.gov opportunities through the opportunity search API."""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlencode, urlparse
+
+from scrape_sam import (
+    SESSION_DIR,
+    OpportunityScraper,
+    PlaywrightSessionManager,
+    ScrapeConfig,
+)
+from utils.http_client import SessionHttpClient
+from utils.rate_limit import AdaptiveRateLimiter, RequestPolicy
+
+
+LOGGER = logging.getLogger(__name__)
+
+SEARCH_API_URL = "https://api.sam.gov/opportunities/v2/search"
+SAM_OPPORTUNITY_URL = "https://sam.gov/opp/{notice_id}/view"
+
+SEARCH_DATE_FORMAT = "%m/%d/%Y"
+# The search API rejects posted-date windows longer than a year and pages
+# larger than 1000 records.
+MAX_SEARCH_WINDOW_DAYS = 365
+MAX_PAGE_SIZE = 1000
+DEFAULT_LOOKBACK_DAYS = 7
+
+
+@dataclass
+class SearchFilters:
+    posted_from: Optional[date] = None
+    posted_to: Optional[date] = None
+    naics: Optional[str] = None
+    psc: Optional[str] = None
+    set_aside: Optional[str] = None
+
+    def key(self) -> str:
+        """Identify the filter combination a high-water mark belongs to."""
+
+        return "|".join(
+            f"{name}={value or ''}"
+            for name, value in (
+                ("naics", self.naics),
+                ("psc", self.psc),
+                ("set_aside", self.set_aside),
+            )
+        )
+
+    def to_params(self) -> Dict[str, str]:
+        params = {
+            "postedFrom": self.posted_from.strftime(SEARCH_DATE_FORMAT),
+            "postedTo": self.posted_to.strftime(SEARCH_DATE_FORMAT),
+        }
+        if self.naics:
+            params["ncode"] = self.naics
+        if self.psc:
+            params["ccode"] = self.psc
+        if self.set_aside:
+            params["typeOfSetAside"] = self.set_aside
+        return params
+
+
+class DiscoveryState:
+    """High-water marks from earlier discovery runs, keyed by filter combination.
+
+    Each entry holds the latest posted date seen and the notice IDs posted on
+    that date, so the next run can start from that date without re-emitting
+    notices it already handed to the scraper.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def record(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+
+    def save(self) -> None:
+        with self._lock:
+            snapshot = dict(self._entries)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            json.dump(snapshot, handle, indent=2)
+        temp_path.replace(self.path)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable discovery state %s: %s", self.path, exc)
+            return {}
+
+
+class OpportunitySearch:
+    """Page through the search API, fetching pages concurrently.
+
+    The first page is fetched alone to learn the total record count; the
+    remaining pages are then requested in parallel and yielded in order as
+    they arrive.
+    """
+
+    def __init__(
+        self,
+        *,
+        search_url: str = SEARCH_API_URL,
+        api_key: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        concurrency: int = 4,
+        request_policy: Optional[RequestPolicy] = None,
+        http_client: Optional[SessionHttpClient] = None,
+    ) -> None:
+        self.search_url = search_url
+        self.api_key = api_key
+        self.page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        self.concurrency = max(1, concurrency)
+        self.request_policy = request_policy or RequestPolicy(limiter=AdaptiveRateLimiter())
+        self.http_client = http_client or SessionHttpClient(
+            None, max_connections=self.concurrency
+        )
+
+    def iter_notices(self, filters: SearchFilters) -> Iterator[Dict[str, Any]]:
+        first = self._fetch_page(filters, 0)
+        yield from first.get("opportunitiesData") or []
+
+        total = int(first.get("totalRecords") or 0)
+        offsets = range(self.page_size, total, self.page_size)
+        if not offsets:
+            return
+
+        LOGGER.info(
+            "Search matched %s notices; fetching %s more page(s)", total, len(offsets)
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="discover"
+        )
+        try:
+            pages = executor.map(lambda offset: self._fetch_page(filters, offset), offsets)
+            for page in pages:
+                yield from page.get("opportunitiesData") or []
+        finally:
+            # Don't fetch the rest of the result set if the consumer stopped early.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def close(self) -> None:
+        self.http_client.dispose()
+
+    def _fetch_page(self, filters: SearchFilters, offset: int) -> Dict[str, Any]:
+        params = filters.to_params()
+        params.update({"limit": str(self.page_size), "offset": str(offset)})
+        if self.api_key:
+            params["api_key"] = self.api_key
+        url = f"{self.search_url}?{urlencode(params)}"
+
+        response = self.request_policy.execute(
+            urlparse(url).netloc,
+            lambda: self.http_client.get(url),
+            label=f"search page at offset {offset}",
+        )
+        if response.status >= 400:
+            raise RuntimeError(
+                f"Search API returned status {response.status} at offset {offset}"
+            )
+        return response.json()
+
+
+class OpportunityDiscovery:
+    """Turn search results into scrape rows and track the high-water mark."""
+
+    def __init__(
+        self,
+        *,
+        search: OpportunitySearch,
+        filters: SearchFilters,
+        state: DiscoveryState,
+    ) -> None:
+        self.search = search
+        self.state = state
+        self.filters = filters
+        self._previous = state.get(filters.key())
+        self._latest_posted: Optional[date] = None
+        self._latest_ids: set[str] = set()
+        self.discovered = 0
+
+        self._resolve_window()
+
+    def iter_rows(self) -> Iterator[Dict[str, str]]:
+        skip_ids = set((self._previous or {}).get("notice_ids", []))
+        seen: set[str] = set()
+        for notice in self.search.iter_notices(self.filters):
+            notice_id = str(notice.get("noticeId") or "").strip()
+            if not notice_id or notice_id in seen or notice_id in skip_ids:
+                continue
+            seen.add(notice_id)
+            self._track_posted(notice_id, notice.get("postedDate"))
+            self.discovered += 1
+            yield {
+                "sam-url": notice.get("uiLink")
+                or SAM_OPPORTUNITY_URL.format(notice_id=notice_id),
+                "notice_id": notice_id,
+                "title": notice.get("title") or "",
+                "posted_date": notice.get("postedDate") or "",
+            }
+
+    def commit(self) -> None:
+        """Advance the high-water mark past every notice yielded so far."""
+
+        if self._latest_posted is None:
+            return
+        previous_date = _parse_posted_date((self._previous or {}).get("posted_date"))
+        notice_ids = set(self._latest_ids)
+        if previous_date == self._latest_posted:
+            notice_ids.update((self._previous or {}).get("notice_ids", []))
+        self.state.record(
+            self.filters.key(),
+            {
+                "posted_date": self._latest_posted.isoformat(),
+                "notice_ids": sorted(notice_ids),
+            },
+        )
+        self.state.save()
+
+    def _resolve_window(self) -> None:
+        filters = self.filters
+        if filters.posted_to is None:
+            filters.posted_to = date.today()
+        if filters.posted_from is None:
+            watermark = _parse_posted_date((self._previous or {}).get("posted_date"))
+            if watermark is not None:
+                # Start on the watermark day; notices already seen on it are skipped.
+                filters.posted_from = watermark
+                LOGGER.info("Discovering notices posted since %s", watermark.isoformat())
+            else:
+                filters.posted_from = filters.posted_to - timedelta(days=DEFAULT_LOOKBACK_DAYS)
+        if filters.posted_from > filters.posted_to:
+            raise ValueError("posted_from must not be after posted_to")
+        if (filters.posted_to - filters.posted_from).days > MAX_SEARCH_WINDOW_DAYS:
+            raise ValueError(
+                f"The search API accepts posted-date windows of at most {MAX_SEARCH_WINDOW_DAYS} days"
+            )
+
+    def _track_posted(self, notice_id: str, posted: Any) -> None:
+        posted_date = _parse_posted_date(posted)
+        if posted_date is None:
+            return
+        if self._latest_posted is None or posted_date > self._latest_posted:
+            self._latest_posted = posted_date
+            self._latest_ids = {notice_id}
+        elif posted_date == self._latest_posted:
+            self._latest_ids.add(notice_id)
+
+
+def discover_opportunities(
+    *,
+    output_dir: Path,
+    filters: SearchFilters,
+    search_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    search_concurrency: int = 4,
+    scrape: bool = True,
+    require_login: bool = False,
+    limit: Optional[int] = None,
+    concurrency: int = 2,
+    page_load: str = "auto",
+    page_wait: str = "ready",
+    use_cache: bool = True,
+    full_refresh: bool = False,
+    request_rate: float = 4.0,
+    backend: str = "http",
+    cdp_url: Optional[str] = None,
+    download_concurrency: int = 4,
+    attachment_policy: Optional[Path] = None,
+    max_attachment_bytes: Optional[int] = None,
+    attachment_history: bool = False,
+) -> None:
+    """Entry point invoked by the CLI.
+
+    Discovered notices are written to ``<out>/discovery/discovered-*.csv`` and,
+    unless ``scrape`` is False, streamed into the scraper as they are found.
+    The high-water mark only advances once every matching notice has been
+    handed over, so a failed, limited or interrupted run is retried in full.
+    """
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    api_key = api_key or os.getenv("SAM_API_KEY")
+
+    search = OpportunitySearch(
+        search_url=search_url or SEARCH_API_URL,
+        api_key=api_key,
+        page_size=page_size,
+        concurrency=search_concurrency,
+        request_policy=RequestPolicy(limiter=AdaptiveRateLimiter(rate=request_rate)),
+    )
+    discovery = OpportunityDiscovery(
+        search=search,
+        filters=filters,
+        state=DiscoveryState(output_dir / "state" / "discover-state.json"),
+    )
+
+    discovery_dir = output_dir / "discovery"
+    discovery_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    discovered_csv = discovery_dir / f"discovered-{timestamp}.csv"
+
+    try:
+        with discovered_csv.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(
+                handle, fieldnames=["sam-url", "notice_id", "title", "posted_date"]
+            )
+            writer.writeheader()
+
+            complete = True
+
+            def rows() -> Iterator[Dict[str, str]]:
+                nonlocal complete
+                notices = discovery.iter_rows()
+                try:
+                    for row in itertools.islice(notices, limit):
+                        writer.writerow(row)
+                        handle.flush()
+                        yield row
+                except Exception:  # pylint: disable=broad-except
+                    # Scrape what was found so far; the next run starts over.
+                    LOGGER.exception("Discovery stopped early")
+                    complete = False
+                    return
+                if limit is not None and next(notices, None) is not None:
+                    complete = False
+
+            if scrape:
+                config = ScrapeConfig(
+                    input_csv=discovered_csv,
+                    output_dir=output_dir,
+                    require_login=require_login,
+                    concurrency=concurrency,
+                    page_load=page_load,
+                    page_wait=page_wait,
+                    use_cache=use_cache,
+                    full_refresh=full_refresh,
+                    request_rate=request_rate,
+                    backend="browser" if cdp_url else backend,
+                    cdp_url=cdp_url,
+                    download_concurrency=download_concurrency,
+                    attachment_policy=attachment_policy,
+                    max_attachment_bytes=max_attachment_bytes,
+                    attachment_history=attachment_history,
+                )
+                manager = PlaywrightSessionManager(SESSION_DIR)
+                manager.prepare_session(require_login=require_login)
+                scraper = OpportunityScraper(config=config, session_manager=manager)
+                results = scraper.run(rows())
+                LOGGER.info("Scraped %s discovered opportunities", len(results))
+            else:
+                for _ in rows():
+                    pass
+    finally:
+        search.close()
+
+    if complete:
+        discovery.commit()
+    else:
+        LOGGER.warning("Discovery incomplete; high-water mark left unchanged")
+    LOGGER.info("Discovered %s new notice(s); list saved to %s", discovery.discovered, discovered_csv)
+
+
+def _parse_posted_date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    text = str(value).strip()
+    for candidate in (text, text[:10]):
+        try:
+            return datetime.fromisoformat(candidate).date()
+        except ValueError:
+            continue
+    try:
+        return datetime.strptime(text, SEARCH_DATE_FORMAT).date()
+    except ValueError:
+        return None
+
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+from datetime import date
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -14,6 +15,14 @@ def _parse_path(path_str: str) -> Path:
     return Path(path_str).expanduser().resolve()
 
 
+def _parse_date(date_str: str) -> date:
+    return date.fromisoformat(date_str)
+
+
+def _megabytes(value: Optional[float]) -> Optional[int]:
+    return int(value * 1024 * 1024) if value is not None else None
+
+
 def _configure_logging(verbosity: int) -> None:
     level = logging.WARNING
     if verbosity == 1:
@@ -34,10 +43,74 @@ def _add_scrape_parser(subparsers: argparse._SubParsersAction[argparse.ArgumentP
     )
     parser.add_argument("--input", type=_parse_path, required=True, help="Path to input.csv containing sam-url values")
     parser.add_argument("--out", type=_parse_path, required=True, help="Output directory root (timestamped artifacts are created inside)")
+    _add_scrape_options(parser)
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted scrape, skipping rows already finished successfully in the journal")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument("--record-fixtures", type=_parse_path, default=None, help="Save every SAM.gov response of this run into a fixture directory")
+    fixtures.add_argument("--replay-fixtures", type=_parse_path, default=None, help="Serve all HTTP requests from a recorded fixture directory (offline, no login)")
+    parser.set_defaults(handler=_run_scrape)
+
+
+def _add_scrape_options(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--login", action="store_true", help="Open a visible browser to refresh the SAM.gov session before scraping")
     parser.add_argument("--limit", type=int, default=None, help="Optional max number of opportunities to process (for testing)")
-    parser.add_argument("--concurrency", type=int, default=2, help="Max concurrent page loads/downloads")
-    parser.set_defaults(handler=_run_scrape)
+    parser.add_argument("--concurrency", type=int, default=2, help="Number of parallel scrape workers")
+    parser.add_argument("--download-concurrency", type=int, default=4, help="Max parallel attachment downloads within one opportunity")
+    parser.add_argument(
+        "--page-load",
+        choices=["auto", "always"],
+        default="auto",
+        help="With --backend browser, render the SAM.gov page only when the API leaves title/description or attachments empty (auto), or for every row (always); the http backend cannot render pages and marks rows still missing a title or description page_not_rendered",
+    )
+    parser.add_argument(
+        "--page-wait",
+        choices=["ready", "networkidle"],
+        default="ready",
+        help="When rendering, block images/fonts/styles/analytics and stop once the resources API answered and meta tags exist (ready), or load everything and wait for network idle (networkidle, for timing comparisons)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk SAM API response cache")
+    parser.add_argument("--full-refresh", action="store_true", help="Re-scrape every opportunity even if it is unchanged since the last run")
+    parser.add_argument("--request-rate", type=float, default=4.0, help="Initial requests/second per host; adapts down on 429/503 and back up on success")
+    parser.add_argument(
+        "--backend",
+        choices=["http", "browser"],
+        default="http",
+        help="Fetch with a plain HTTP client reusing the saved session (http), or also render pages in headless Chromium (browser)",
+    )
+    parser.add_argument("--cdp-url", default=None, help="Render pages in an already running Chromium at this CDP endpoint (implies --backend browser)")
+    parser.add_argument("--attachment-policy", type=_parse_path, default=None, help="JSON attachment admission policy (max_bytes, allowed_types, blocked_names, blocked_sha256)")
+    parser.add_argument("--attachment-history", action="store_true", help="Also download deleted and superseded attachment versions into <out>/attachment-history (never summarized)")
+    parser.add_argument("--max-attachment-mb", type=float, default=None, help="Skip attachments larger than this many MiB (overrides the policy file)")
+
+
+def _add_discover_parser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    parser = subparsers.add_parser(
+        "discover",
+        help="Find opportunities through the SAM.gov search API and scrape them as they are found",
+    )
+    parser.add_argument("--out", type=_parse_path, required=True, help="Output directory root (discovery lists, state and scrape artifacts are created inside)")
+    parser.add_argument("--posted-from", type=_parse_date, default=None, help="First posted date (YYYY-MM-DD); defaults to the last run's high-water mark, or 7 days back")
+    parser.add_argument("--posted-to", type=_parse_date, default=None, help="Last posted date (YYYY-MM-DD); defaults to today")
+    parser.add_argument("--naics", default=None, help="Only notices with this NAICS code")
+    parser.add_argument("--psc", default=None, help="Only notices with this PSC (classification) code")
+    parser.add_argument("--set-aside", default=None, help="Only notices with this set-aside type code (e.g. SBA, 8A, SDVOSBC)")
+    parser.add_argument("--search-url", default=None, help="Opportunity search endpoint (override to point at a stub server)")
+    parser.add_argument("--api-key", default=None, help="SAM.gov API key for the search endpoint (defaults to SAM_API_KEY)")
+    parser.add_argument("--page-size", type=int, default=1000, help="Search results per page (max 1000)")
+    parser.add_argument("--search-concurrency", type=int, default=4, help="Number of search result pages fetched in parallel")
+    parser.add_argument("--no-scrape", action="store_true", help="Only list discovered notices; do not scrape them")
+    _add_scrape_options(parser)
+    parser.set_defaults(handler=_run_discover)
+
+
+def _add_reextract_parser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    parser = subparsers.add_parser(
+        "reextract",
+        help="Rebuild sam-metadata.csv from archived API payloads without scraping; a notice is archived by the first scrape that sees it, even if unchanged",
+    )
+    parser.add_argument("--out", type=_parse_path, required=True, help="Scrape output directory holding archive/payloads-*.jsonl.gz")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to the number of CPUs)")
+    parser.set_defaults(handler=_run_reextract)
 
 
 def _add_summarize_docs_parser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -51,7 +124,10 @@ def _add_summarize_docs_parser(subparsers: argparse._SubParsersAction[argparse.A
     parser.add_argument("--model", type=str, default="gemini-flash-lite-latest", help="Gemini model name to use")
     parser.add_argument("--run-id", type=str, default=None, help="Optional run identifier to embed in outputs")
     parser.add_argument("--max-workers", type=int, default=2, help="Max parallel Gemini requests")
+    parser.add_argument("--extract-workers", type=int, default=None, help="Text extraction processes (defaults to the number of CPUs)")
     parser.add_argument("--skip-existing", action="store_true", help="Skip files that already have summaries in the latest CSV")
+    parser.add_argument("--no-text-cache", action="store_true", help="Extract text from every file instead of reusing <out>/cache/text")
+    parser.add_argument("--text-cache-mb", type=float, default=1024, help="Size cap of the extracted-text cache; least recently used entries are evicted")
     parser.set_defaults(handler=_run_summarize_docs)
 
 
@@ -66,6 +142,7 @@ def _add_summarize_opps_parser(subparsers: argparse._SubParsersAction[argparse.A
     parser.add_argument("--model", type=str, default="gemini-flash-lite-latest", help="Gemini model name to use")
     parser.add_argument("--run-id", type=str, default=None, help="Optional run identifier to embed in outputs")
     parser.add_argument("--max-workers", type=int, default=2, help="Max parallel Gemini requests")
+    parser.add_argument("--skip-existing", action="store_true", help="Reuse earlier summaries whose metadata and document summaries are unchanged, including identical notices in the same chain")
     parser.set_defaults(handler=_run_summarize_opps)
 
 
@@ -75,6 +152,8 @@ def build_arg_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", required=True)
     _add_scrape_parser(subparsers)
+    _add_discover_parser(subparsers)
+    _add_reextract_parser(subparsers)
     _add_summarize_docs_parser(subparsers)
     _add_summarize_opps_parser(subparsers)
 
@@ -97,9 +176,63 @@ def _run_scrape(args: argparse.Namespace) -> None:
         require_login=args.login,
         limit=args.limit,
         concurrency=args.concurrency,
+        page_load=args.page_load,
+        page_wait=args.page_wait,
+        use_cache=not args.no_cache,
+        full_refresh=args.full_refresh,
+        resume=args.resume,
+        request_rate=args.request_rate,
+        backend=args.backend,
+        cdp_url=args.cdp_url,
+        download_concurrency=args.download_concurrency,
+        attachment_policy=args.attachment_policy,
+        max_attachment_bytes=_megabytes(args.max_attachment_mb),
+        attachment_history=args.attachment_history,
+        record_fixtures=args.record_fixtures,
+        replay_fixtures=args.replay_fixtures,
+    )
+
+
+def _run_discover(args: argparse.Namespace) -> None:
+    from discover_sam import SearchFilters, discover_opportunities
+
+    discover_opportunities(
+        output_dir=args.out,
+        filters=SearchFilters(
+            posted_from=args.posted_from,
+            posted_to=args.posted_to,
+            naics=args.naics,
+            psc=args.psc,
+            set_aside=args.set_aside,
+        ),
+        search_url=args.search_url,
+        api_key=args.api_key,
+        page_size=args.page_size,
+        search_concurrency=args.search_concurrency,
+        scrape=not args.no_scrape,
+        require_login=args.login,
+        limit=args.limit,
+        concurrency=args.concurrency,
+        page_load=args.page_load,
+        page_wait=args.page_wait,
+        use_cache=not args.no_cache,
+        full_refresh=args.full_refresh,
+        request_rate=args.request_rate,
+        backend=args.backend,
+        cdp_url=args.cdp_url,
+        download_concurrency=args.download_concurrency,
+        attachment_policy=args.attachment_policy,
+        max_attachment_bytes=_megabytes(args.max_attachment_mb),
+        attachment_history=args.attachment_history,
     )
 
 
+def _run_reextract(args: argparse.Namespace) -> None:
+    from scrape_sam import reextract_metadata
+
+    reextract_metadata(output_dir=args.out, workers=args.workers)
+
+
 def _run_summarize_docs(args: argparse.Namespace) -> None:
     from summarize_docs import summarize_documents
 
@@ -111,6 +244,9 @@ def _run_summarize_docs(args: argparse.Namespace) -> None:
         run_id=args.run_id,
         max_workers=args.max_workers,
         skip_existing=args.skip_existing,
+        extract_workers=args.extract_workers,
+        use_text_cache=not args.no_text_cache,
+        text_cache_max_bytes=_megabytes(args.text_cache_mb),
     )
 
 
@@ -124,6 +260,7 @@ def _run_summarize_opps(args: argparse.Namespace) -> None:
         model=args.model,
         run_id=args.run_id,
         max_workers=args.max_workers,
+        skip_existing=args.skip_existing,
     )
 
 
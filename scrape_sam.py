@@ -2,36 +2,67 @@
 
 from __future__ import annotations
 
+import contextvars
 import csv
-import io
+import hashlib
+import importlib.util
+import itertools
 import json
 import logging
 import mimetypes
+import os
+import queue
 import random
 import re
+import shutil
+import subprocess
 import sys
+import tempfile
+import threading
 import time
 import zipfile
-from datetime import datetime
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 from urllib.parse import unquote, urljoin, urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from playwright.sync_api import (
     BrowserContext,
-    APIRequestContext,
     Page,
+    Route,
     TimeoutError as PlaywrightTimeoutError,
     sync_playwright,
 )
 
+from utils.attachment_policy import AdmissionPolicy
+from utils.content_store import BLOBS_DIR_NAME, ContentStore
+from utils.http_cache import ResponseCache, cache_key_for_url
+from utils.http_client import SessionHttpClient, load_storage_state, storage_state_expired
+from utils.http_fixtures import build_fixture_transport
+from utils.payload_archive import (
+    ARCHIVE_DIR_NAME,
+    PayloadArchive,
+    archive_paths,
+    iter_archive_lines,
+)
+from utils.rate_limit import AdaptiveRateLimiter, RequestPolicy, RequestStats, track_requests
+
 
 LOGGER = logging.getLogger(__name__)
 
 SAM_HOME_URL = "https://sam.gov/content/home"
 SESSION_DIR = Path(".playwright/session")
+STORAGE_STATE_PATH = Path(".playwright/storage-state.json")
+SAM_COOKIE_DOMAIN = "sam.gov"
+
+# The signed-in user's profile: unlike the public api_key=null endpoints below
+# it only answers with the session cookies, so it is a cheap session probe.
+SESSION_CHECK_URL = "https://sam.gov/api/prod/users/v1/users/me?api_key=null&random={nonce}"
 
 OPPORTUNITY_DETAIL_URL = (
     "https://sam.gov/api/prod/opps/v2/opportunities/{opportunity_id}?api_key=null&random={nonce}"
@@ -43,9 +74,26 @@ ATTACHMENTS_LIST_URL = (
     "https://sam.gov/api/prod/opps/v3/opportunities/{opportunity_id}/resources?api_key=null&excludeDeleted=false&withScanResult=false&random={nonce}"
 )
 ATTACHMENT_DOWNLOAD_URL = (
-    "https://sam.gov/api/prod/opps/v3/opportunities/{opportunity_id}/resources/download/zip?api_key=null&resourceIds={resource_id}&random={nonce}"
+    "https://sam.gov/api/prod/opps/v3/opportunities/{opportunity_id}/resources/download/zip?api_key=null&resourceIds={resource_ids}&random={nonce}"
 )
 
+# How long cached API responses stay fresh. Organizations rarely change, while
+# opportunity details and resource lists are amended during a notice's life.
+ORGANIZATION_CACHE_TTL = 7 * 24 * 3600
+OPPORTUNITY_CACHE_TTL = 3600
+ATTACHMENTS_CACHE_TTL = 3600
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# lxml is much faster than the pure-Python parser on the large SAM SPA pages.
+# It is in requirements.txt; html.parser is only a fallback for environments
+# installed without it.
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# The page extractors only read <meta> and <a> tags, so pages are parsed once
+# with everything else skipped.
+PAGE_TAGS = SoupStrainer(["meta", "a"])
+
 METADATA_HEADERS = [
     "sam-url",
     "opportunity_id",
@@ -61,8 +109,54 @@ METADATA_HEADERS = [
     "department",
     "sub_tier",
     "office",
+    "chain_id",
 ]
 
+# Fields the HTML extractor can backfill; in "auto" page-load mode the SAM page
+# is only rendered when the API leaves one of these empty.
+REQUIRED_METADATA_FIELDS = ("title", "description")
+
+# Site-wide meta tags of the SAM.gov single-page app shell, present before the
+# opportunity has rendered; they say nothing about the notice.
+GENERIC_PAGE_TITLE = re.compile(r"^(?:home\s*\|\s*)?sam\.gov(?:\s*\|\s*home)?$", re.IGNORECASE)
+GENERIC_PAGE_DESCRIPTION = re.compile(
+    r"^(?:sam\.gov\W*)?the system for award management \(sam\) is", re.IGNORECASE
+)
+
+PAGE_LOAD_MODES = ("auto", "always")
+
+# "ready" blocks non-essential resources and returns once the opportunity's
+# resources API call has answered and the notice's own meta tags have replaced
+# the shell's;
+# "networkidle" loads everything and waits for the network to go quiet, which
+# is slower but kept as a baseline for comparing page timings.
+PAGE_WAIT_MODES = ("ready", "networkidle")
+PAGE_NAVIGATION_TIMEOUT_MS = 90_000
+PAGE_READY_TIMEOUT_MS = 15_000
+# Resolves once a title or description meta tag holds something other than
+# the generic shell value, i.e. the notice itself has rendered.
+PAGE_READY_SCRIPT = """([titlePattern, descriptionPattern]) => {
+    const read = (selector) => {
+        const meta = document.querySelector(selector);
+        return meta ? (meta.getAttribute("content") || "").trim() : "";
+    };
+    const title = read('meta[property="og:title"]') || read('meta[name="twitter:title"]');
+    const description = read('meta[name="description"]');
+    return (title && !new RegExp(titlePattern, "i").test(title))
+        || (description && !new RegExp(descriptionPattern, "i").test(description));
+}"""
+
+# Nothing the extractors read depends on these, so rendered pages skip them.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+BLOCKED_URL_PATTERN = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|"
+    r"dap\.digitalgov\.gov|nr-data\.net|newrelic\.com"
+)
+
+# "http" talks to SAM.gov with a plain HTTP client built from the saved session;
+# "browser" additionally renders opportunity pages in headless Chromium.
+SCRAPE_BACKENDS = ("http", "browser")
+
 
 @dataclass
 class ScrapeConfig:
@@ -71,6 +165,22 @@ class ScrapeConfig:
     require_login: bool = False
     limit: Optional[int] = None
     concurrency: int = 2
+    page_load: str = "auto"
+    page_wait: str = "ready"
+    cache_dir: Optional[Path] = None
+    use_cache: bool = True
+    full_refresh: bool = False
+    resume: bool = False
+    request_rate: float = 4.0
+    max_attempts: int = 5
+    download_concurrency: int = 4
+    backend: str = "http"
+    cdp_url: Optional[str] = None
+    record_fixtures: Optional[Path] = None
+    replay_fixtures: Optional[Path] = None
+    attachment_policy: Optional[Path] = None
+    max_attachment_bytes: Optional[int] = None
+    attachment_history: bool = False
 
 
 @dataclass
@@ -89,6 +199,7 @@ class OpportunityMetadata:
     department: str = ""
     sub_tier: str = ""
     office: str = ""
+    chain_id: str = ""
 
     def to_csv_row(self) -> Dict[str, str]:
         return {
@@ -106,6 +217,7 @@ class OpportunityMetadata:
             "department": self.department,
             "sub_tier": self.sub_tier,
             "office": self.office,
+            "chain_id": self.chain_id,
         }
 
     def update(self, **fields: str) -> None:
@@ -125,6 +237,9 @@ class AttachmentInfo:
     local_path: Optional[Path] = None
     attachment_id: Optional[str] = None
     resource_id: Optional[str] = None
+    sha256: Optional[str] = None
+    skipped: Optional[str] = None
+    history: Optional[str] = None
 
 
 @dataclass
@@ -134,6 +249,12 @@ class OpportunityResult:
     errors: List[str] = field(default_factory=list)
     payload: Optional[Dict[str, Any]] = None
     status: str = "success"
+    unchanged: bool = False
+    modified: str = ""
+    timings: Dict[str, float] = field(default_factory=dict)
+    http: Dict[str, Any] = field(default_factory=dict)
+    page_not_rendered: bool = False
+    archived: bool = False
 
 
 def scrape_opportunities(
@@ -143,19 +264,63 @@ def scrape_opportunities(
     require_login: bool,
     limit: Optional[int],
     concurrency: int,
+    page_load: str = "auto",
+    page_wait: str = "ready",
+    use_cache: bool = True,
+    full_refresh: bool = False,
+    resume: bool = False,
+    request_rate: float = 4.0,
+    backend: str = "http",
+    cdp_url: Optional[str] = None,
+    record_fixtures: Optional[Path] = None,
+    replay_fixtures: Optional[Path] = None,
+    download_concurrency: int = 4,
+    attachment_policy: Optional[Path] = None,
+    max_attachment_bytes: Optional[int] = None,
+    attachment_history: bool = False,
 ) -> None:
     """Entry point invoked by the CLI."""
 
+    if page_load not in PAGE_LOAD_MODES:
+        raise ValueError(f"page_load must be one of {PAGE_LOAD_MODES}, got {page_load!r}")
+    if page_wait not in PAGE_WAIT_MODES:
+        raise ValueError(f"page_wait must be one of {PAGE_WAIT_MODES}, got {page_wait!r}")
+    if backend not in SCRAPE_BACKENDS:
+        raise ValueError(f"backend must be one of {SCRAPE_BACKENDS}, got {backend!r}")
+    if record_fixtures and replay_fixtures:
+        raise ValueError("record_fixtures and replay_fixtures are mutually exclusive")
+    if cdp_url and not replay_fixtures:
+        # Attaching to a browser only matters when pages are rendered.
+        backend = "browser"
+    if replay_fixtures:
+        # Replayed runs never leave the recorded HTTP traffic.
+        backend = "http"
+
     config = ScrapeConfig(
         input_csv=input_csv,
         output_dir=output_dir,
         require_login=require_login,
         limit=limit,
         concurrency=concurrency,
+        page_load=page_load,
+        page_wait=page_wait,
+        use_cache=use_cache,
+        full_refresh=full_refresh,
+        resume=resume,
+        request_rate=request_rate,
+        backend=backend,
+        cdp_url=cdp_url,
+        record_fixtures=record_fixtures,
+        replay_fixtures=replay_fixtures,
+        download_concurrency=download_concurrency,
+        attachment_policy=attachment_policy,
+        max_attachment_bytes=max_attachment_bytes,
+        attachment_history=attachment_history,
     )
 
     manager = PlaywrightSessionManager(SESSION_DIR)
-    manager.prepare_session(require_login=config.require_login)
+    if not config.replay_fixtures:
+        manager.prepare_session(require_login=config.require_login)
 
     config.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -164,47 +329,199 @@ def scrape_opportunities(
     LOGGER.info("Scraped %s opportunities", len(results))
 
 
+REEXTRACT_CHUNK_SIZE = 200
+
+
+def reextract_metadata(*, output_dir: Path, workers: Optional[int] = None) -> Path:
+    """Rebuild sam-metadata.csv from archived API payloads without scraping.
+
+    Archives are read oldest first so the latest payload of each opportunity
+    wins. Values the API leaves empty keep what the CSV already holds, since
+    those came from the page fallback, which is not archived. Only a few
+    chunks per worker are in flight, so archives are streamed rather than
+    read into memory up front.
+    """
+
+    paths = archive_paths(output_dir)
+    if not paths:
+        raise FileNotFoundError(f"No payload archives found under {output_dir / ARCHIVE_DIR_NAME}")
+
+    metadata_path = output_dir / "metadata" / "sam-metadata.csv"
+    rows = OpportunityScraper._load_existing_metadata(metadata_path)
+
+    lines = iter_archive_lines(paths)
+    chunks = iter(lambda: list(itertools.islice(lines, REEXTRACT_CHUNK_SIZE)), [])
+    extracted = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight_limit = (workers or os.cpu_count() or 1) * 2
+        for chunk_rows in _map_in_order(executor, _reextract_chunk, chunks, in_flight_limit):
+            for row in chunk_rows:
+                existing = rows.get(row["sam-url"], {})
+                rows[row["sam-url"]] = {
+                    header: row.get(header) or existing.get(header, "")
+                    for header in METADATA_HEADERS
+                }
+                extracted += 1
+
+    metadata_path.parent.mkdir(parents=True, exist_ok=True)
+    write_metadata_csv(metadata_path, rows)
+    LOGGER.info(
+        "Re-extracted %s payload(s) from %s archive(s) into %s",
+        extracted,
+        len(paths),
+        metadata_path,
+    )
+    return metadata_path
+
+
+def _map_in_order(
+    executor: ProcessPoolExecutor,
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    in_flight_limit: int,
+) -> Iterator[Any]:
+    """Like ``executor.map`` but submitting at most ``in_flight_limit`` items ahead."""
+
+    pending: "deque[Future]" = deque()
+    for item in items:
+        if len(pending) >= in_flight_limit:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _reextract_chunk(lines: List[str]) -> List[Dict[str, str]]:
+    rows: List[Dict[str, str]] = []
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        opportunity = record.get("opportunity")
+        if not opportunity:
+            continue
+        metadata = OpportunityMetadata(
+            sam_url=record["sam_url"], opportunity_id=record["opportunity_id"]
+        )
+        metadata.update(**extract_metadata_from_api(opportunity, record.get("organization")))
+        rows.append(metadata.to_csv_row())
+    return rows
+
+
+def write_metadata_csv(path: Path, rows: Dict[str, Dict[str, str]]) -> None:
+    """Write metadata rows sorted by sam-url, replacing ``path`` atomically."""
+
+    temp_path = path.with_suffix(".tmp")
+    with temp_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=METADATA_HEADERS)
+        writer.writeheader()
+        for sam_url in sorted(rows.keys()):
+            writer.writerow(rows[sam_url])
+    temp_path.replace(path)
+
+
 class PlaywrightSessionManager:
     """Handle persistent browser sessions for SAM.gov."""
 
-    def __init__(self, session_dir: Path) -> None:
+    def __init__(
+        self, session_dir: Path, storage_state_path: Path = STORAGE_STATE_PATH
+    ) -> None:
         self.session_dir = session_dir
+        self.storage_state_path = storage_state_path
 
     def prepare_session(self, *, require_login: bool) -> None:
-        """Ensure the persistent session directory is initialized."""
+        """Ensure a SAM.gov session exists, opening a browser only to log in.
+
+        A saved session whose SAM.gov cookies have all expired counts as
+        missing. Cookies that look live are still probed against the API by
+        the scraper before any work starts.
+        """
 
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
-        has_existing_state = any(self.session_dir.iterdir())
+        has_existing_state = self.has_saved_state() or any(self.session_dir.iterdir())
         if not has_existing_state and not require_login:
             LOGGER.warning(
                 "No existing SAM.gov session found. Re-run the command with --login to authenticate."
             )
             require_login = True
+        elif not require_login and storage_state_expired(
+            self.load_storage_state(), SAM_COOKIE_DOMAIN
+        ):
+            LOGGER.warning("The saved SAM.gov session has expired; opening a browser to log in again.")
+            require_login = True
+
+        if not require_login:
+            LOGGER.debug("Reusing existing SAM.gov session")
+            return
 
         with sync_playwright() as playwright:
-            context = self._launch_context(playwright, headless=not require_login)
+            context = self._launch_context(playwright, headless=False)
             try:
                 page = context.new_page()
                 page.goto(SAM_HOME_URL, wait_until="load")
-
-                if require_login:
-                    LOGGER.info(
-                        "Browser opened for SAM.gov login. Complete authentication and wait for the script to continue."
-                    )
-                    if sys.stdin and sys.stdin.isatty():
-                        input("Press Enter after you finish logging in...")
-                    else:
-                        # Allow time for interactive login in non-interactive environments.
-                        time.sleep(120)
+                LOGGER.info(
+                    "Browser opened for SAM.gov login. Complete authentication and wait for the script to continue."
+                )
+                if sys.stdin and sys.stdin.isatty():
+                    input("Press Enter after you finish logging in...")
                 else:
-                    LOGGER.debug("Validated existing SAM.gov session in headless mode.")
+                    # Allow time for interactive login in non-interactive environments.
+                    time.sleep(120)
+                self._save_storage_state(context)
             finally:
                 context.close()
 
+    def has_saved_state(self) -> bool:
+        return self.storage_state_path.exists()
+
     def launch_context(self, playwright, *, headless: bool = True) -> BrowserContext:
         return self._launch_context(playwright, headless=headless)
 
+    def export_storage_state(self) -> Dict[str, Any]:
+        """Return cookies and local storage from the persistent profile."""
+
+        with sync_playwright() as playwright:
+            context = self._launch_context(playwright, headless=True)
+            try:
+                return self._save_storage_state(context)
+            finally:
+                context.close()
+
+    def load_storage_state(self) -> Dict[str, Any]:
+        """Return the saved session, exporting it from the profile if needed.
+
+        Only the export needs a browser; once the state file holds unexpired
+        cookies scrapes can run without launching Chromium. A stale file is
+        refreshed from the persistent profile, which may have newer cookies.
+        """
+
+        storage_state = load_storage_state(self.storage_state_path)
+        if storage_state is None or storage_state_expired(storage_state, SAM_COOKIE_DOMAIN):
+            storage_state = self.export_storage_state()
+        return storage_state
+
+    def launch_worker_context(
+        self, playwright, storage_state: Dict[str, Any], endpoint: str
+    ) -> BrowserContext:
+        """Open an isolated context, seeded with the saved session, on a shared browser.
+
+        The persistent profile can only be opened by one browser at a time, so
+        scrape workers each attach to the browser at ``endpoint`` over CDP and
+        get a regular context carrying the exported state.
+        """
+
+        browser = playwright.chromium.connect_over_cdp(endpoint)
+        return browser.new_context(
+            storage_state=storage_state,
+            viewport={"width": 1280, "height": 720},
+        )
+
+    def _save_storage_state(self, context: BrowserContext) -> Dict[str, Any]:
+        self.storage_state_path.parent.mkdir(parents=True, exist_ok=True)
+        return context.storage_state(path=str(self.storage_state_path))
+
     def _launch_context(self, playwright, *, headless: bool) -> BrowserContext:
         browser = playwright.chromium
 
@@ -217,6 +534,195 @@ class PlaywrightSessionManager:
         return context
 
 
+class SharedBrowser:
+    """A single Chromium per scrape that every browser worker attaches to.
+
+    Playwright's sync API cannot share a ``Browser`` object between threads, so
+    the browser is started as a plain process with a DevTools port and each
+    worker connects to it over CDP. When ``cdp_url`` is given an already
+    running browser is used instead and left running afterwards.
+    """
+
+    def __init__(self, cdp_url: Optional[str] = None) -> None:
+        self._endpoint = cdp_url
+        self._process: Optional[subprocess.Popen] = None
+        self._profile_dir: Optional[Path] = None
+        self._lock = threading.Lock()
+
+    def endpoint(self, executable_path: str) -> str:
+        """Return the CDP endpoint, launching Chromium on first use."""
+
+        with self._lock:
+            if self._endpoint is None:
+                self._endpoint = self._launch(executable_path)
+            return self._endpoint
+
+    def close(self) -> None:
+        with self._lock:
+            if self._process is not None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
+                self._process = None
+                self._endpoint = None
+            if self._profile_dir is not None:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
+                self._profile_dir = None
+
+    def _launch(self, executable_path: str) -> str:
+        self._profile_dir = Path(tempfile.mkdtemp(prefix="sam-chromium-"))
+        self._process = subprocess.Popen(
+            [
+                executable_path,
+                "--headless=new",
+                "--remote-debugging-port=0",
+                f"--user-data-dir={self._profile_dir}",
+                "--no-first-run",
+                "--no-default-browser-check",
+                "about:blank",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        # Chromium writes the port it picked to DevToolsActivePort once ready.
+        port_file = self._profile_dir / "DevToolsActivePort"
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Chromium exited with status {self._process.returncode}")
+            lines = port_file.read_text().splitlines() if port_file.exists() else []
+            if len(lines) >= 2:
+                endpoint = f"ws://127.0.0.1:{lines[0]}{lines[1]}"
+                LOGGER.info("Launched shared Chromium at %s", endpoint)
+                return endpoint
+            time.sleep(0.05)
+        raise RuntimeError("Timed out waiting for Chromium to start")
+
+
+class ScrapeStateIndex:
+    """Change markers and attachment inventory from earlier scrape runs.
+
+    Entries are keyed by opportunity ID and hold the opportunity's modified
+    marker, its metadata row and the attachments (resource ID, size, sha256,
+    local path) stored for it, so reruns can skip unchanged notices.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def get(self, opportunity_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(opportunity_id)
+
+    def record(self, opportunity_id: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[opportunity_id] = entry
+
+    def chain_members(self, chain_id: str, *, exclude: str = "") -> List[Dict[str, Any]]:
+        """Return the entries of other notices recorded for the same chain."""
+
+        if not chain_id:
+            return []
+        with self._lock:
+            return [
+                entry
+                for opportunity_id, entry in self._entries.items()
+                if opportunity_id != exclude
+                and entry.get("metadata", {}).get("chain_id") == chain_id
+            ]
+
+    def save(self) -> None:
+        with self._lock:
+            snapshot = dict(self._entries)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            json.dump(snapshot, handle)
+        temp_path.replace(self.path)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable scrape state %s: %s", self.path, exc)
+            return {}
+
+
+class ScrapeJournal:
+    """Append-only JSONL record of finished opportunities.
+
+    Every completed row is flushed to disk as soon as it finishes so an
+    interrupted scrape can be resumed, and the final metadata CSV and manifest
+    are rebuilt from this file rather than from in-memory state.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf-8")
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Return the latest entry per sam-url, ignoring a torn final line."""
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        if not self.path.exists():
+            return entries
+
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    LOGGER.warning(
+                        "Skipping unreadable journal line %s in %s", line_number, self.path
+                    )
+                    continue
+                if entry.get("sam_url"):
+                    entries[entry["sam_url"]] = entry
+        return entries
+
+
+class RunManifest:
+    """Line-per-opportunity JSONL manifest written while the scrape runs.
+
+    Lines are compact (no descriptions) and carry stage timings, byte counts
+    and HTTP retry counts, so a run can be inspected with line-oriented tools.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+
+
 class OpportunityScraper:
     def __init__(self, *, config: ScrapeConfig, session_manager: PlaywrightSessionManager) -> None:
         self.config = config
@@ -224,39 +730,108 @@ class OpportunityScraper:
         self.metadata_dir = self.config.output_dir / "metadata"
         self.attachments_dir = self.config.output_dir / "attachments"
         self.manifest_dir = self.config.output_dir / "manifests"
+        self.downloads_dir = self.config.output_dir / "downloads"
+        self.history_dir = self.config.output_dir / "attachment-history"
+        self.state_index = ScrapeStateIndex(
+            self.config.output_dir / "state" / "scrape-state.json"
+        )
+        self.journal = ScrapeJournal(self.manifest_dir / "scrape-journal.jsonl")
+        self.run_manifest = RunManifest(
+            self.manifest_dir / f"manifest-{datetime.utcnow():%Y%m%d-%H%M%S}.jsonl"
+        )
+        self.payload_archive = PayloadArchive(
+            self.config.output_dir
+            / ARCHIVE_DIR_NAME
+            / f"payloads-{datetime.utcnow():%Y%m%d-%H%M%S}.jsonl.gz"
+        )
+        self._stop_event = threading.Event()
+        self.content_store = ContentStore(self.config.output_dir / BLOBS_DIR_NAME)
+        self.admission_policy = (
+            AdmissionPolicy.from_file(
+                self.config.attachment_policy, max_bytes=self.config.max_attachment_bytes
+            )
+            if self.config.attachment_policy
+            else AdmissionPolicy(max_bytes=self.config.max_attachment_bytes)
+        )
+        self.request_policy = RequestPolicy(
+            limiter=AdaptiveRateLimiter(rate=self.config.request_rate),
+            max_attempts=self.config.max_attempts,
+        )
+        self.response_cache = ResponseCache(
+            self.config.cache_dir or self.config.output_dir / "cache" / "http",
+            enabled=self.config.use_cache,
+        )
+        self.http_client: Optional[SessionHttpClient] = None
+        self.io_executor: Optional[ThreadPoolExecutor] = None
+        self.shared_browser: Optional[SharedBrowser] = None
         self.results: List[OpportunityResult] = []
 
-    def run(self) -> List[OpportunityResult]:
-        rows = self._load_input_rows()
-        if not rows:
-            LOGGER.warning("No sam-url entries found in %s", self.config.input_csv)
-            return []
+    def run(self, rows: Optional[Iterable[Dict[str, str]]] = None) -> List[OpportunityResult]:
+        """Scrape ``rows``, or the input CSV when no rows are given.
+
+        ``rows`` may be a lazy iterable (e.g. search discovery); rows are fed to
+        the workers as they arrive.
+        """
+
+        if rows is None:
+            rows = self._load_input_rows()
+            if not rows:
+                LOGGER.warning("No sam-url entries found in %s", self.config.input_csv)
+                return []
 
         self._ensure_output_dirs()
 
-        with sync_playwright() as playwright:
-            context = self.session_manager.launch_context(playwright, headless=True)
-            api_context = playwright.request.new_context(
-                storage_state=context.storage_state()
+        finished: set[str] = set()
+        if self.config.resume:
+            finished = {
+                sam_url
+                for sam_url, entry in self.journal.load().items()
+                if entry.get("status") == "success"
+            }
+        else:
+            self.journal.reset()
+
+        seen_rows: List[Dict[str, str]] = []
+
+        def pending_rows() -> Iterator[Dict[str, str]]:
+            for row in rows:
+                seen_rows.append(row)
+                if row["sam-url"].strip() not in finished:
+                    yield row
+
+        total: Optional[int] = None
+        if isinstance(rows, list):
+            # Journal entries for URLs outside this input must not be counted.
+            total = sum(1 for row in rows if row["sam-url"].strip() not in finished)
+
+        interrupted = False
+        try:
+            self._scrape_rows(pending_rows(), total=total)
+        except KeyboardInterrupt:
+            interrupted = True
+            LOGGER.warning("Interrupted; writing outputs for finished rows (use --resume to continue)")
+        finally:
+            self.payload_archive.close()
+
+        if self.config.resume:
+            LOGGER.info(
+                "Resumed: %s of %s row(s) were already finished",
+                sum(1 for row in seen_rows if row["sam-url"].strip() in finished),
+                len(seen_rows),
             )
-            try:
-                page = context.new_page()
-                for index, row in enumerate(rows, start=1):
-                    result = self._process_row(
-                        page,
-                        api_context,
-                        row,
-                        index=index,
-                        total=len(rows),
-                    )
-                    self.results.append(result)
-            finally:
-                api_context.dispose()
-                context.close()
 
+        journal_entries = self.journal.load()
+        self.results = [
+            self._result_from_entry(journal_entries[sam_url])
+            for sam_url in dict.fromkeys(row["sam-url"].strip() for row in seen_rows)
+            if sam_url in journal_entries
+        ]
+
+        self._update_state_index(self.results)
         self._write_metadata(self.results)
         self._write_manifest(self.results)
         successes = sum(1 for result in self.results if result.status == "success")
+        unchanged = sum(1 for result in self.results if result.unchanged)
         attachments_downloaded = sum(
             1
             for result in self.results
@@ -266,13 +841,248 @@ class OpportunityScraper:
         failures = len(self.results) - successes
 
         LOGGER.info(
-            "Scrape finished: %s success, %s with errors, %s attachments downloaded",
+            "Scrape finished: %s success (%s unchanged), %s with errors, %s attachments on disk",
             successes,
+            unchanged,
             failures,
             attachments_downloaded,
         )
+        http_stats = self.request_policy.stats.to_dict()
+        LOGGER.info(
+            "HTTP: %s requests, %s retries, %s throttled responses, %.1fs spent throttled, %.1f MiB downloaded",
+            http_stats["requests"],
+            http_stats["retries"],
+            http_stats["throttled_responses"],
+            http_stats["throttled_seconds"],
+            http_stats["bytes_received"] / 2**20,
+        )
+        if interrupted:
+            raise KeyboardInterrupt
         return self.results
 
+    def _scrape_rows(self, rows: Iterator[Dict[str, str]], *, total: Optional[int]) -> None:
+        # Exhausting the iterator still lets run() see every input row.
+        first = next(rows, None)
+        if first is None or total == 0:
+            for _ in rows:
+                pass
+            LOGGER.info("Nothing left to scrape")
+            return
+
+        if self.config.replay_fixtures:
+            storage_state: Dict[str, Any] = {}
+        else:
+            storage_state = self.session_manager.load_storage_state()
+        worker_count = max(1, self.config.concurrency)
+        if total is not None:
+            worker_count = max(1, min(worker_count, total))
+
+        LOGGER.info(
+            "Scraping %s opportunities with %s worker(s) using the %s backend",
+            total if total is not None else "discovered",
+            worker_count,
+            self.config.backend,
+        )
+
+        # One pooled keep-alive client carries every API call and download.
+        self.http_client = SessionHttpClient(
+            storage_state,
+            max_connections=max(10, worker_count * 4),
+            transport=build_fixture_transport(
+                record_dir=self.config.record_fixtures,
+                replay_dir=self.config.replay_fixtures,
+            ),
+        )
+        if self.config.backend == "browser":
+            self.shared_browser = SharedBrowser(self.config.cdp_url)
+        self.io_executor = ThreadPoolExecutor(
+            max_workers=worker_count * 2, thread_name_prefix="scrape-io"
+        )
+        try:
+            if not self.config.replay_fixtures:
+                self._check_session()
+            self._run_workers(
+                itertools.chain([first], rows), storage_state, worker_count, total
+            )
+        finally:
+            self.io_executor.shutdown(wait=True)
+            self.io_executor = None
+            self.http_client.dispose()
+            self.http_client = None
+            if self.shared_browser is not None:
+                self.shared_browser.close()
+                self.shared_browser = None
+
+    @staticmethod
+    def _enqueue(
+        work_queue: "queue.Queue[Optional[tuple[int, Dict[str, str]]]]",
+        item: Optional[tuple[int, Dict[str, str]]],
+        futures: List[Any],
+    ) -> bool:
+        """Put ``item`` on the queue unless every worker has already exited."""
+
+        while True:
+            try:
+                work_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                if all(future.done() for future in futures):
+                    return False
+
+    def _check_session(self) -> None:
+        """Probe an authenticated SAM endpoint before starting the workers.
+
+        An expired session is either refused outright or redirected to the
+        login page; both stop the scrape before any row is processed.
+        """
+
+        response = self._api_get(SESSION_CHECK_URL.format(nonce=self._nonce()), label="session check")
+        if response.status in (401, 403) or "/api/" not in urlparse(response.url).path:
+            raise RuntimeError(
+                "SAM.gov rejected the saved session. Re-run the command with --login to authenticate."
+            )
+        if response.status >= 400:
+            LOGGER.warning("Session check returned status %s; continuing", response.status)
+        else:
+            LOGGER.debug("Session check returned status %s", response.status)
+
+    def _run_workers(
+        self,
+        rows: Iterator[Dict[str, str]],
+        storage_state: Dict[str, Any],
+        worker_count: int,
+        total: Optional[int],
+    ) -> None:
+        # A bounded queue lets a slow producer (search discovery) and the
+        # workers overlap without buffering the whole input.
+        work_queue: "queue.Queue[Optional[tuple[int, Dict[str, str]]]]" = queue.Queue(
+            maxsize=worker_count * 2
+        )
+        with ThreadPoolExecutor(
+            max_workers=worker_count, thread_name_prefix="scrape-worker"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._run_worker,
+                    work_queue,
+                    storage_state,
+                    total,
+                )
+                for _ in range(worker_count)
+            ]
+            try:
+                try:
+                    for index, row in enumerate(rows):
+                        if not self._enqueue(work_queue, (index, row), futures):
+                            break
+                except KeyboardInterrupt:
+                    self._stop_event.set()
+                    raise
+                finally:
+                    for _ in range(worker_count):
+                        self._enqueue(work_queue, None, futures)
+                for future in futures:
+                    future.result()
+            except KeyboardInterrupt:
+                # Let workers finish the row they are on, then stop.
+                self._stop_event.set()
+                raise
+
+    def _run_worker(
+        self,
+        work_queue: "queue.Queue[Optional[tuple[int, Dict[str, str]]]]",
+        storage_state: Dict[str, Any],
+        total: Optional[int],
+    ) -> None:
+        if self.config.backend != "browser":
+            self._consume_queue(work_queue, None, total)
+            return
+
+        # Playwright's sync API is bound to the thread that started it, so each
+        # browser worker owns its own driver and page on the shared browser.
+        # Chromium is only launched once a row actually needs a rendered page.
+        with sync_playwright() as playwright:
+            pages: List[Page] = []
+
+            def get_page() -> Page:
+                if not pages:
+                    endpoint = self.shared_browser.endpoint(
+                        playwright.chromium.executable_path
+                    )
+                    context = self.session_manager.launch_worker_context(
+                        playwright, storage_state, endpoint
+                    )
+                    if self.config.page_wait == "ready":
+                        context.route("**/*", _block_nonessential)
+                    pages.append(context.new_page())
+                return pages[0]
+
+            try:
+                self._consume_queue(work_queue, get_page, total)
+            finally:
+                for page in pages:
+                    browser = page.context.browser
+                    page.context.close()
+                    if browser is not None:
+                        browser.close()
+
+    def _consume_queue(
+        self,
+        work_queue: "queue.Queue[Optional[tuple[int, Dict[str, str]]]]",
+        get_page: Optional[Callable[[], Page]],
+        total: Optional[int],
+    ) -> None:
+        while True:
+            item = work_queue.get()
+            if item is None or self._stop_event.is_set():
+                return
+            index, row = item
+            try:
+                result = self._process_row(
+                    get_page,
+                    row,
+                    index=index + 1,
+                    total=total if total is not None else "?",
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.exception("Worker failed on %s", row.get("sam-url"))
+                sam_url = row["sam-url"].strip()
+                result = OpportunityResult(
+                    metadata=OpportunityMetadata(
+                        sam_url=sam_url,
+                        opportunity_id=parse_opportunity_id(sam_url),
+                    ),
+                    errors=[f"error: {exc}"],
+                    status="error",
+                )
+            self._archive_payload(result)
+            self.journal.append(self._manifest_entry(result))
+            self.run_manifest.append(self._run_manifest_entry(result))
+            # Later notices of the same chain in this run can reuse its files.
+            self._record_state(result)
+
+    def _archive_payload(self, result: OpportunityResult) -> None:
+        if not result.payload or not result.payload.get("opportunity"):
+            return
+        if result.unchanged:
+            previous = self.state_index.get(result.metadata.opportunity_id) or {}
+            if previous.get("archived"):
+                # The payload is already in an older archive.
+                result.archived = True
+                return
+            # Notices last scraped before archiving existed are archived on the
+            # first pass that sees them; the organization was not refetched.
+        self.payload_archive.append(
+            {
+                "sam_url": result.metadata.sam_url,
+                "opportunity_id": result.metadata.opportunity_id,
+                "archived_at": datetime.utcnow().isoformat() + "Z",
+                "opportunity": result.payload["opportunity"],
+                "organization": result.payload.get("organization"),
+            }
+        )
+        result.archived = True
+
     def _load_input_rows(self) -> List[Dict[str, str]]:
         with self.config.input_csv.open("r", encoding="utf-8-sig", newline="") as handle:
             reader = csv.DictReader(handle)
@@ -294,15 +1104,38 @@ class OpportunityScraper:
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
         self.attachments_dir.mkdir(parents=True, exist_ok=True)
         self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        self.downloads_dir.mkdir(parents=True, exist_ok=True)
 
     def _process_row(
         self,
-        page: Page,
-        api_context: APIRequestContext,
+        get_page: Optional[Callable[[], Page]],
+        row: Dict[str, str],
+        *,
+        index: int,
+        total: Union[int, str],
+    ) -> OpportunityResult:
+        """Scrape one row, recording its stage timings and HTTP counters."""
+
+        stats = RequestStats()
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        with track_requests(stats):
+            result = self._scrape_row(
+                get_page, row, index=index, total=total, timings=timings
+            )
+        timings["total"] = time.perf_counter() - started
+        result.timings = {stage: round(seconds, 3) for stage, seconds in timings.items()}
+        result.http = stats.to_dict()
+        return result
+
+    def _scrape_row(
+        self,
+        get_page: Optional[Callable[[], Page]],
         row: Dict[str, str],
         *,
         index: int,
-        total: int,
+        total: Union[int, str],
+        timings: Dict[str, float],
     ) -> OpportunityResult:
         sam_url = row["sam-url"].strip()
         opportunity_id = parse_opportunity_id(sam_url)
@@ -311,39 +1144,94 @@ class OpportunityScraper:
 
         LOGGER.info("[%s/%s] Processing %s", index, total, sam_url)
 
-        api_data = self._fetch_opportunity_json(api_context, opportunity_id)
-        org_data = None
-        if api_data:
-            org_id = api_data.get("data2", {}).get("organizationId")
-            if org_id:
-                org_data = self._fetch_organization_json(api_context, org_id)
+        with _timed(timings, "opportunity_api"):
+            api_data = self._fetch_opportunity_json(opportunity_id)
+        marker = opportunity_modified_marker(api_data)
+        result.modified = marker
+        previous = None if self.config.full_refresh else self.state_index.get(opportunity_id)
+
+        if previous and self._restore_unchanged(result, previous, marker):
+            LOGGER.info("[%s/%s] Unchanged since last scrape; skipping %s", index, total, sam_url)
+            result.payload = {"opportunity": api_data, "organization": None}
+            return result
+
+        # The organization and the resources list only depend on the opportunity
+        # JSON, so both are requested at once while this thread renders the page
+        # if it is already known to be needed.
+        org_future = None
+        org_id = (api_data or {}).get("data2", {}).get("organizationId")
+        if org_id:
+            org_future = self.io_executor.submit(
+                contextvars.copy_context().run, self._fetch_organization_json, org_id
+            )
+        attachments_future = self.io_executor.submit(
+            contextvars.copy_context().run, self._fetch_attachments_list, opportunity_id
+        )
 
         try:
-            page.goto(sam_url, wait_until="networkidle", timeout=90_000)
-            html = page.content()
-            fields: Dict[str, str] = {}
+            page_html = None
+            # Organization fields are merged in once that request has answered.
+            fields = extract_metadata_from_api(api_data, None) if api_data else {}
+            if get_page is not None and self._needs_page(fields, None):
+                with _timed(timings, "page"):
+                    page_html = self._load_page_html(get_page, sam_url)
 
-            if api_data:
-                fields.update(extract_metadata_from_api(api_data, org_data))
+            # Time still spent waiting on the organization/resources requests.
+            with _timed(timings, "related_api"):
+                org_data = org_future.result() if org_future else None
+                attachments = attachments_future.result()
 
-            html_fields = extract_metadata_from_html(html)
-            for key, value in html_fields.items():
-                if not fields.get(key):
-                    fields[key] = value
+            fields.update(extract_organization_fields(org_data))
 
-            metadata.update(**fields)
             result.payload = {
                 "opportunity": api_data,
                 "organization": org_data,
             }
 
-            result.attachments = self._collect_attachments(
-                api_context=api_context,
-                opportunity_id=opportunity_id,
-                sam_url=sam_url,
-                html=html,
-            )
-            self._download_attachments(api_context, result)
+            if page_html is None and self._needs_page(fields, attachments):
+                if get_page is None:
+                    # The unrendered SPA shell has neither the notice's meta
+                    # tags nor its attachment links. Many notices have no
+                    # attachments, so an empty list alone is taken as final.
+                    missing = [key for key in REQUIRED_METADATA_FIELDS if not fields.get(key)]
+                    if missing:
+                        result.page_not_rendered = True
+                        LOGGER.warning(
+                            "%s has no %s in the API and the http backend cannot render "
+                            "the page; rerun with --backend browser to fill it in",
+                            sam_url,
+                            " or ".join(missing),
+                        )
+                    else:
+                        LOGGER.debug("Not rendering %s without a browser", sam_url)
+                else:
+                    with _timed(timings, "page"):
+                        page_html = self._load_page_html(get_page, sam_url)
+            elif page_html is None:
+                LOGGER.debug("API data complete for %s; skipping page load", sam_url)
+
+            if page_html is not None:
+                soup = parse_page(page_html)
+
+                html_fields = extract_metadata_from_html(soup)
+                for key, value in html_fields.items():
+                    if not fields.get(key):
+                        fields[key] = value
+
+                if not attachments:
+                    attachments = collect_attachments_from_html(soup, sam_url)
+
+            metadata.update(**fields)
+            result.attachments = attachments
+            # Known-good downloads, including files shared with earlier notices
+            # of the same chain, are reused even on a full refresh.
+            with _timed(timings, "downloads"):
+                self._download_attachments(
+                    result,
+                    previous=self._chain_previous(
+                        metadata, previous or self.state_index.get(opportunity_id)
+                    ),
+                )
         except PlaywrightTimeoutError as exc:
             LOGGER.exception("Timeout loading %s", sam_url)
             result.errors.append(f"timeout: {exc}")
@@ -356,83 +1244,453 @@ class OpportunityScraper:
 
         return result
 
+    def _restore_unchanged(
+        self, result: OpportunityResult, previous: Dict[str, Any], marker: str
+    ) -> bool:
+        """Fill ``result`` from the state index when the notice has not changed."""
+
+        if not marker or previous.get("modified") != marker:
+            return False
+
+        attachments = [
+            self._attachment_from_record(record)
+            for record in previous.get("attachments", [])
+        ]
+        for attachment in attachments:
+            if attachment.sha256 and not (
+                attachment.local_path and attachment.local_path.exists()
+            ):
+                # Files were removed since the last run; scrape again.
+                return False
+
+        result.metadata.update(**previous.get("metadata", {}))
+        result.attachments = attachments
+        result.unchanged = True
+        return True
+
+    def _load_page_html(self, get_page: Callable[[], Page], sam_url: str) -> str:
+        """Return the opportunity page HTML as rendered in Chromium.
+
+        SAM.gov is a client-rendered app: only the rendered page carries the
+        notice's meta tags and attachment links, so the http backend has no
+        page fallback at all.
+        """
+
+        page = get_page()
+        started = time.perf_counter()
+        if self.config.page_wait == "networkidle":
+            page.goto(sam_url, wait_until="networkidle", timeout=PAGE_NAVIGATION_TIMEOUT_MS)
+            navigated = ready = time.perf_counter()
+        else:
+            navigated, ready = self._goto_until_ready(page, sam_url)
+        LOGGER.info(
+            "Rendered %s in %.2fs (navigation %.2fs, ready wait %.2fs, %s mode)",
+            sam_url,
+            ready - started,
+            navigated - started,
+            ready - navigated,
+            self.config.page_wait,
+        )
+        return page.content()
+
+    def _goto_until_ready(self, page: Page, sam_url: str) -> tuple[float, float]:
+        """Navigate and wait only for what the page extractors read.
+
+        The SPA lists attachment links once its call to the opportunity's
+        resources API has answered, and the title/description come from meta
+        tags, which only count once they differ from the shell's generic
+        ones; whatever has rendered is used if either wait times out.
+        Returns the ``perf_counter`` times navigation and readiness finished.
+        """
+
+        resources_path = f"/opportunities/{parse_opportunity_id(sam_url)}/resources"
+        navigated = None
+        try:
+            with page.expect_response(
+                lambda response: resources_path in response.url,
+                timeout=PAGE_READY_TIMEOUT_MS,
+            ):
+                page.goto(
+                    sam_url, wait_until="domcontentloaded", timeout=PAGE_NAVIGATION_TIMEOUT_MS
+                )
+                navigated = time.perf_counter()
+        except PlaywrightTimeoutError:
+            if navigated is None:
+                raise
+            LOGGER.debug("Page %s never requested its resources list", sam_url)
+        try:
+            page.wait_for_function(
+                PAGE_READY_SCRIPT,
+                arg=[GENERIC_PAGE_TITLE.pattern, GENERIC_PAGE_DESCRIPTION.pattern],
+                timeout=PAGE_READY_TIMEOUT_MS,
+            )
+        except PlaywrightTimeoutError:
+            LOGGER.debug("Page %s never replaced the generic meta tags", sam_url)
+        return navigated, time.perf_counter()
+
+    def _chain_previous(
+        self, metadata: OpportunityMetadata, previous: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Combine this notice's last record with those of its chain siblings."""
+
+        siblings = self.state_index.chain_members(
+            metadata.chain_id, exclude=metadata.opportunity_id
+        )
+        if not siblings:
+            return previous
+        attachments = [
+            record for entry in siblings for record in entry.get("attachments", [])
+        ]
+        # The notice's own records come last so they win on shared keys.
+        attachments.extend((previous or {}).get("attachments", []))
+        return {**(previous or {}), "attachments": attachments}
+
+    def _needs_page(
+        self, fields: Dict[str, str], attachments: Optional[List[AttachmentInfo]]
+    ) -> bool:
+        """Decide whether the page is needed; ``attachments`` is None while unknown."""
+
+        if self.config.page_load == "always":
+            return True
+        if attachments is not None and not attachments:
+            return True
+        return any(not fields.get(key) for key in REQUIRED_METADATA_FIELDS)
+
     def _download_attachments(
-        self, api_context: APIRequestContext, result: OpportunityResult
+        self,
+        result: OpportunityResult,
+        *,
+        previous: Optional[Dict[str, Any]] = None,
     ) -> None:
         if not result.attachments:
             return
 
-        opportunity_dir = self.attachments_dir / result.metadata.opportunity_id
+        self._apply_admission_policy(result)
+
+        opportunity_id = result.metadata.opportunity_id
+        current = [attachment for attachment in result.attachments if not attachment.history]
+        history = [attachment for attachment in result.attachments if attachment.history]
+        if current:
+            self._download_attachment_group(
+                result, current, self.attachments_dir / opportunity_id, previous
+            )
+        if history:
+            # Kept apart from the attachments tree so it is never summarized.
+            self._download_attachment_group(
+                result, history, self.history_dir / opportunity_id, previous
+            )
+
+    def _download_attachment_group(
+        self,
+        result: OpportunityResult,
+        attachments: List[AttachmentInfo],
+        opportunity_dir: Path,
+        previous: Optional[Dict[str, Any]],
+    ) -> None:
         opportunity_dir.mkdir(parents=True, exist_ok=True)
 
         used_names: set[str] = set()
 
-        for attachment in result.attachments:
+        if previous:
+            self._reuse_previous_downloads(
+                attachments, previous, opportunity_dir, used_names
+            )
+
+        resources = [
+            attachment
+            for attachment in attachments
+            if attachment.resource_id and not attachment.local_path and not attachment.skipped
+        ]
+        singles = [
+            attachment
+            for attachment in attachments
+            if not attachment.resource_id and not attachment.local_path and not attachment.skipped
+        ]
+
+        # Network transfers run in parallel; naming and linking happen below in
+        # attachment order so filenames stay deterministic.
+        tasks: List[Callable[[], Any]] = []
+        if resources:
+            tasks.append(
+                lambda: self._fetch_resource_bundle(result.metadata.opportunity_id, resources)
+            )
+        tasks.extend(
+            (lambda attachment=attachment: self._fetch_single_attachment(attachment))
+            for attachment in singles
+        )
+        outcomes = self._run_downloads(tasks)
+
+        if resources:
+            extracted, error = outcomes.pop(0)
             try:
-                output_path = self._download_single_attachment(
-                    api_context,
-                    result.metadata.opportunity_id,
-                    attachment,
+                if error is not None:
+                    raise error
+                self._place_resource_bundle(
+                    result,
+                    resources,
+                    extracted,
                     opportunity_dir,
                     used_names,
                 )
-                if output_path:
-                    attachment.local_path = output_path
-                    LOGGER.info("Downloaded attachment %s", output_path.name)
             except Exception as exc:  # pylint: disable=broad-except
-                LOGGER.exception(
+                LOGGER.error(
+                    "Failed to download attachment bundle for %s",
+                    result.metadata.opportunity_id,
+                    exc_info=exc,
+                )
+                result.errors.append(f"attachments:{exc}")
+
+        for attachment, (digest, error) in zip(singles, outcomes):
+            if error is not None:
+                LOGGER.error(
                     "Failed to download attachment %s from %s",
                     attachment.name,
-                    attachment.url or attachment.resource_id,
+                    attachment.url,
+                    exc_info=error,
                 )
-                result.errors.append(f"attachment:{attachment.name}:{exc}")
+                result.errors.append(f"attachment:{attachment.name}:{error}")
+                continue
+            reason = self.admission_policy.check_content(
+                digest, self.content_store.blob_path(digest).stat().st_size
+            )
+            if reason:
+                self._skip_attachment(attachment, reason)
+                continue
+            attachment.local_path = self._place_blob(
+                digest, self._build_filename(attachment), opportunity_dir, used_names
+            )
+            attachment.sha256 = digest
+            LOGGER.info("Downloaded attachment %s", attachment.local_path.name)
 
-    def _download_single_attachment(
+    def _run_downloads(
+        self, tasks: List[Callable[[], Any]]
+    ) -> List[tuple[Any, Optional[Exception]]]:
+        """Run download tasks up to ``download_concurrency`` at a time.
+
+        Returns one ``(value, error)`` pair per task, in task order.
+        """
+
+        def attempt(task: Callable[[], Any]) -> tuple[Any, Optional[Exception]]:
+            try:
+                return task(), None
+            except Exception as exc:  # pylint: disable=broad-except
+                return None, exc
+
+        limit = min(self.config.download_concurrency, len(tasks))
+        if limit <= 1:
+            return [attempt(task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=limit, thread_name_prefix="download") as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, attempt, task) for task in tasks
+            ]
+            return [future.result() for future in futures]
+
+    def _apply_admission_policy(self, result: OpportunityResult) -> None:
+        """Mark listed attachments the admission policy rules out before download."""
+
+        for attachment in result.attachments:
+            if attachment.skipped or attachment.local_path:
+                continue
+            reason = self.admission_policy.check(
+                attachment.name, attachment.file_type, _advertised_size(attachment)
+            )
+            if reason:
+                self._skip_attachment(attachment, reason)
+
+    def _skip_attachment(self, attachment: AttachmentInfo, reason: str) -> None:
+        attachment.skipped = reason
+        attachment.local_path = None
+        LOGGER.info("Skipping attachment %s: %s", attachment.name, reason)
+
+    def _reuse_previous_downloads(
         self,
-        api_context: APIRequestContext,
-        opportunity_id: str,
-        attachment: AttachmentInfo,
+        attachments: List[AttachmentInfo],
+        previous: Dict[str, Any],
         destination_dir: Path,
         used_names: set[str],
-    ) -> Optional[Path]:
-        if attachment.resource_id:
-            zip_bytes = self._download_attachment_zip(
-                api_context, opportunity_id, attachment.resource_id
+    ) -> None:
+        """Link attachments already held from the last scrape instead of downloading.
+
+        An attachment is reused when its resource ID (or URL) and advertised
+        size match the earlier record and a copy with that SHA-256 is still on
+        disk, either in the content store or at the recorded local path.
+        """
+
+        known: Dict[str, Dict[str, Any]] = {}
+        for record in previous.get("attachments", []):
+            if not record.get("sha256"):
+                continue
+            for key in (record.get("resource_id"), record.get("url")):
+                if key:
+                    known[key] = record
+        reused = 0
+        for attachment in attachments:
+            if attachment.skipped:
+                continue
+            record = known.get(attachment.resource_id or attachment.url or "")
+            if not record or record.get("size") != attachment.size:
+                continue
+            digest = record["sha256"]
+            if not self._has_verified_copy(digest, record, attachment):
+                continue
+            attachment.sha256 = digest
+            reason = self.admission_policy.check_content(
+                digest, self.content_store.blob_path(digest).stat().st_size
+            )
+            if reason:
+                self._skip_attachment(attachment, reason)
+                continue
+            local_name = Path(record.get("local_path") or "").name or self._build_filename(attachment)
+            attachment.local_path = self._place_blob(
+                digest, local_name, destination_dir, used_names
+            )
+            reused += 1
+
+        if reused:
+            LOGGER.info(
+                "Reused %s unchanged attachment(s) for %s", reused, destination_dir.name
             )
-            if not zip_bytes:
+
+    def _has_verified_copy(
+        self, digest: str, record: Dict[str, Any], attachment: AttachmentInfo
+    ) -> bool:
+        blob = self.content_store.blob_path(digest)
+        if not blob.exists():
+            # Adopt a hash-verified file from an older run back into the store.
+            local_path = self._attachment_from_record(record).local_path
+            if local_path is None or not self.content_store.matches(digest, local_path):
+                return False
+            with local_path.open("rb") as handle:
+                self.content_store.put_stream(handle)
+        expected = _advertised_size(attachment)
+        return expected is None or blob.stat().st_size == expected
+
+    def _fetch_resource_bundle(
+        self, opportunity_id: str, resources: List[AttachmentInfo]
+    ) -> List[tuple[str, str, int]]:
+        """Fetch every resource of an opportunity in one zip into the content store."""
+
+        resource_ids = [attachment.resource_id for attachment in resources if attachment.resource_id]
+        for fresh in (False, True):
+            zip_path = self._download_attachment_zip(opportunity_id, resource_ids, fresh=fresh)
+            if not zip_path:
                 raise RuntimeError(
-                    f"Failed to request download for resource {attachment.resource_id}"
+                    f"Failed to request download for {len(resource_ids)} resource(s)"
+                )
+            try:
+                extracted = self._extract_zip_entries(zip_path)
+            except zipfile.BadZipFile as exc:
+                zip_path.unlink(missing_ok=True)
+                if fresh:
+                    raise
+                # A resumed partial may belong to a differently generated archive.
+                LOGGER.warning(
+                    "Archive for %s is damaged (%s); downloading it again", opportunity_id, exc
                 )
-            extracted_paths = self._extract_zip_entries(
-                zip_bytes,
-                destination_dir,
-                attachment.name,
-                used_names,
+                continue
+            zip_path.unlink(missing_ok=True)
+            break
+        if not extracted:
+            raise RuntimeError("Downloaded archive but found no files")
+        return extracted
+
+    def _place_resource_bundle(
+        self,
+        result: OpportunityResult,
+        resources: List[AttachmentInfo],
+        extracted: List[tuple[str, str, int]],
+        destination_dir: Path,
+        used_names: set[str],
+    ) -> None:
+        """Map archive entries back to the listed resources and link them in place."""
+
+        opportunity_id = result.metadata.opportunity_id
+        unmatched = list(resources)
+        present = [attachment for attachment in result.attachments if attachment.local_path]
+        skipped = [attachment for attachment in result.attachments if attachment.skipped]
+        for entry_name, digest, size in extracted:
+            local_name = sanitize_filename(entry_name) or "attachment"
+            attachment = _match_attachment(entry_name, unmatched)
+            if attachment is None:
+                if (
+                    _match_attachment(entry_name, present)
+                    or _match_attachment(entry_name, skipped)
+                    or any(item.sha256 == digest for item in present)
+                ):
+                    # The archive may carry files we already hold or chose to skip.
+                    continue
+                LOGGER.info(
+                    "Archive entry %s for %s did not match a listed attachment",
+                    entry_name,
+                    opportunity_id,
+                )
+                extra = AttachmentInfo(name=entry_name, url="", sha256=digest)
+                reason = self.admission_policy.check(
+                    entry_name, size=size
+                ) or self.admission_policy.check_content(digest, size)
+                if reason:
+                    self._skip_attachment(extra, reason)
+                    skipped.append(extra)
+                else:
+                    extra.local_path = self._place_blob(
+                        digest, local_name, destination_dir, used_names
+                    )
+                    present.append(extra)
+                result.attachments.append(extra)
+                continue
+            unmatched.remove(attachment)
+            expected = _advertised_size(attachment)
+            if expected is not None and size != expected:
+                result.errors.append(
+                    f"attachment:{attachment.name}:size mismatch ({size} bytes, expected {expected})"
+                )
+                continue
+            reason = self.admission_policy.check_content(digest, size)
+            if reason:
+                attachment.sha256 = digest
+                self._skip_attachment(attachment, reason)
+                skipped.append(attachment)
+                continue
+            attachment.local_path = self._place_blob(
+                digest, local_name, destination_dir, used_names
             )
-            if not extracted_paths:
-                raise RuntimeError(
-                    f"Downloaded archive for {attachment.name} but found no files"
+            attachment.sha256 = digest
+            present.append(attachment)
+            LOGGER.info("Downloaded attachment %s", attachment.local_path.name)
+
+        for attachment in unmatched:
+            if attachment.size:
+                result.errors.append(
+                    f"attachment:{attachment.name}:missing from downloaded archive"
+                )
+            else:
+                # Link-type resources have no size and no file in the archive.
+                LOGGER.debug(
+                    "No archive entry for %s (%s); treating as a link",
+                    attachment.name,
+                    attachment.resource_id,
                 )
-            return extracted_paths[0]
+
+    def _fetch_single_attachment(self, attachment: AttachmentInfo) -> str:
+        """Download a URL attachment into the content store and return its digest."""
 
         if not attachment.url:
             raise ValueError("Attachment URL is empty")
 
-        response = api_context.get(attachment.url, timeout=120_000)
-        if response.status >= 400:
-            raise RuntimeError(
-                f"Download failed with status {response.status} for {attachment.url}"
-            )
+        url_key = hashlib.sha1(attachment.url.encode("utf-8")).hexdigest()
+        part_path = self.downloads_dir / f"url-{url_key[:16]}.part"
+        self._stream_download(attachment.url, part_path, label=attachment.name)
 
-        data = response.body()
-        filename = self._build_filename(attachment)
-        unique_name = self._ensure_unique_filename(filename, destination_dir, used_names)
-        output_path = destination_dir / unique_name
-
-        with output_path.open("wb") as handle:
-            handle.write(data)
+        size = part_path.stat().st_size
+        expected = _advertised_size(attachment)
+        if expected is not None and size != expected:
+            part_path.unlink(missing_ok=True)
+            raise RuntimeError(f"size mismatch ({size} bytes, expected {expected})")
 
-        return output_path
+        with part_path.open("rb") as handle:
+            digest, _ = self.content_store.put_stream(handle)
+        part_path.unlink(missing_ok=True)
+        return digest
 
     def _build_filename(self, attachment: AttachmentInfo) -> str:
         preferred = sanitize_filename(attachment.name or "")
@@ -453,9 +1711,29 @@ class OpportunityScraper:
 
         return name
 
-    @staticmethod
+    def _place_blob(
+        self,
+        digest: str,
+        filename: str,
+        destination_dir: Path,
+        used_names: set[str],
+    ) -> Path:
+        """Link a stored blob into the opportunity directory under a free name."""
+
+        unique_name = self._ensure_unique_filename(
+            filename, destination_dir, used_names, digest=digest
+        )
+        output_path = destination_dir / unique_name
+        self.content_store.link(digest, output_path)
+        return output_path
+
     def _ensure_unique_filename(
-        filename: str, destination_dir: Path, used_names: set[str]
+        self,
+        filename: str,
+        destination_dir: Path,
+        used_names: set[str],
+        *,
+        digest: Optional[str] = None,
     ) -> str:
         base = Path(filename)
         stem = base.stem or "attachment"
@@ -463,89 +1741,92 @@ class OpportunityScraper:
 
         candidate = f"{stem}{suffix}"
         counter = 1
-        while candidate in used_names or (destination_dir / candidate).exists():
+        while candidate in used_names or self._is_taken(
+            destination_dir / candidate, digest
+        ):
             candidate = f"{stem}_{counter}{suffix}"
             counter += 1
 
         used_names.add(candidate)
         return candidate
 
+    def _is_taken(self, path: Path, digest: Optional[str]) -> bool:
+        # A file left by an earlier run with identical content is reused in place.
+        if not path.exists():
+            return False
+        return digest is None or not self.content_store.matches(digest, path)
+
     def _fetch_opportunity_json(
-        self, api_context: APIRequestContext, opportunity_id: str
+        self, opportunity_id: str
     ) -> Optional[Dict[str, Any]]:
         url = OPPORTUNITY_DETAIL_URL.format(
             opportunity_id=opportunity_id, nonce=self._nonce()
         )
-        try:
-            response = api_context.get(url, timeout=120_000)
-        except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.warning("Failed to request opportunity JSON for %s: %s", opportunity_id, exc)
-            return None
-
-        if response.status >= 400:
-            LOGGER.warning(
-                "Opportunity API returned status %s for %s", response.status, opportunity_id
-            )
-            return None
-
-        try:
-            return response.json()
-        except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.warning("Invalid JSON for opportunity %s: %s", opportunity_id, exc)
-            return None
+        return self._get_json(
+            url,
+            label=f"opportunity {opportunity_id}",
+            ttl_seconds=OPPORTUNITY_CACHE_TTL,
+        )
 
     def _fetch_organization_json(
-        self, api_context: APIRequestContext, organization_id: str
+        self, organization_id: str
     ) -> Optional[Dict[str, Any]]:
         url = ORGANIZATION_DETAIL_URL.format(
             organization_id=organization_id, nonce=self._nonce()
         )
-        try:
-            response = api_context.get(url, timeout=120_000)
-        except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.warning("Failed to request organization JSON for %s: %s", organization_id, exc)
-            return None
+        return self._get_json(
+            url,
+            label=f"organization {organization_id}",
+            ttl_seconds=ORGANIZATION_CACHE_TTL,
+        )
 
-        if response.status >= 400:
-            LOGGER.warning(
-                "Organization API returned status %s for %s", response.status, organization_id
-            )
-            return None
+    def _get_json(
+        self,
+        url: str,
+        *,
+        label: str,
+        ttl_seconds: float,
+    ) -> Optional[Dict[str, Any]]:
+        """GET a SAM API URL through the response cache; None on any failure."""
 
-        try:
-            return response.json()
-        except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.warning("Invalid JSON for organization %s: %s", organization_id, exc)
-            return None
+        def fetch() -> Optional[Dict[str, Any]]:
+            try:
+                response = self._api_get(url, label=label)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Failed to request %s: %s", label, exc)
+                return None
+
+            if response.status >= 400:
+                LOGGER.warning("API returned status %s for %s", response.status, label)
+                return None
+
+            try:
+                return response.json()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.warning("Invalid JSON for %s: %s", label, exc)
+                return None
+
+        return self.response_cache.get_or_fetch(
+            cache_key_for_url(url), ttl_seconds, fetch
+        )
 
     def _fetch_attachments_list(
-        self, api_context: APIRequestContext, opportunity_id: str
+        self, opportunity_id: str
     ) -> List[AttachmentInfo]:
         url = ATTACHMENTS_LIST_URL.format(
             opportunity_id=opportunity_id, nonce=self._nonce()
         )
-        try:
-            response = api_context.get(url, timeout=120_000)
-        except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.warning(
-                "Failed to request attachments list for %s: %s", opportunity_id, exc
-            )
-            return []
-
-        if response.status >= 400:
-            LOGGER.debug(
-                "Attachments API returned status %s for %s", response.status, opportunity_id
-            )
-            return []
-
-        try:
-            payload = response.json()
-        except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.warning("Invalid attachments JSON for %s: %s", opportunity_id, exc)
+        payload = self._get_json(
+            url,
+            label=f"attachments list {opportunity_id}",
+            ttl_seconds=ATTACHMENTS_CACHE_TTL,
+        )
+        if not payload:
             return []
 
         attachments: List[AttachmentInfo] = []
         seen: set[tuple[str, Optional[str]]] = set()
+        latest: Dict[str, List[tuple[Optional[datetime], AttachmentInfo]]] = {}
 
         for group in payload.get("_embedded", {}).get("opportunityAttachmentList", []):
             for attachment in group.get("attachments", []):
@@ -555,112 +1836,196 @@ class OpportunityScraper:
                 if key in seen:
                     continue
                 seen.add(key)
-                attachments.append(
-                    AttachmentInfo(
-                        name=name,
-                        url="",
-                        file_type=attachment.get("mimeType"),
-                        size=str(attachment.get("size")) if attachment.get("size") else None,
-                        attachment_id=attachment.get("attachmentId"),
-                        resource_id=resource_id,
-                    )
+                info = AttachmentInfo(
+                    name=name,
+                    url="",
+                    file_type=attachment.get("mimeType"),
+                    size=str(attachment.get("size")) if attachment.get("size") else None,
+                    attachment_id=attachment.get("attachmentId"),
+                    resource_id=resource_id,
                 )
+                attachments.append(info)
+                if _is_deleted_resource(attachment):
+                    self._retire_attachment(info, "deleted")
+                    continue
+
+                # Amendments re-upload a document under the same name; a copy is
+                # only retired when both dates are known and another is strictly
+                # newer. Ties and undated copies may be distinct documents.
+                document = sanitize_filename(name).lower()
+                if not document:
+                    continue
+                posted = _parse_posted_date(attachment.get("postedDate"))
+                current = latest.setdefault(document, [])
+                if posted is not None:
+                    newer = [other for other, _ in current if other is not None and other > posted]
+                    if newer:
+                        self._retire_attachment(
+                            info, f"superseded by version posted {max(newer).isoformat()}"
+                        )
+                        continue
+                    for other, older in current:
+                        if other is not None and other < posted:
+                            self._retire_attachment(
+                                older, f"superseded by version posted {posted.isoformat()}"
+                            )
+                    current[:] = [
+                        (other, kept) for other, kept in current if other is None or other >= posted
+                    ]
+                current.append((posted, info))
 
         return attachments
 
+    def _retire_attachment(self, attachment: AttachmentInfo, reason: str) -> None:
+        """Keep a deleted or superseded version out of the current attachments."""
+
+        LOGGER.debug("Attachment %s is not current: %s", attachment.name, reason)
+        if self.config.attachment_history:
+            attachment.history = reason
+        else:
+            attachment.skipped = reason
+
     def _download_attachment_zip(
         self,
-        api_context: APIRequestContext,
         opportunity_id: str,
-        resource_id: str,
-    ) -> Optional[bytes]:
+        resource_ids: List[str],
+        *,
+        fresh: bool = False,
+    ) -> Optional[Path]:
+        """Download the resources archive to a partial file and return its path.
+
+        The partial file is named after the opportunity and resource set, so a
+        transfer cut off in an earlier attempt or run resumes where it stopped
+        unless ``fresh`` is set.
+        """
+
         url = ATTACHMENT_DOWNLOAD_URL.format(
             opportunity_id=opportunity_id,
-            resource_id=resource_id,
+            resource_ids=",".join(resource_ids),
             nonce=self._nonce(),
         )
         try:
-            response = api_context.get(url, timeout=120_000)
+            response = self._api_get(url, label=f"download link {opportunity_id}")
         except Exception as exc:  # pylint: disable=broad-except
             LOGGER.warning(
-                "Failed to request download link for resource %s: %s", resource_id, exc
+                "Failed to request download link for %s: %s", opportunity_id, exc
             )
             return None
 
         if response.status >= 400:
             LOGGER.warning(
-                "Download link request returned status %s for resource %s",
+                "Download link request returned status %s for %s",
                 response.status,
-                resource_id,
+                opportunity_id,
             )
             return None
 
         try:
             payload = response.json()
         except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.warning("Invalid download link JSON for resource %s: %s", resource_id, exc)
+            LOGGER.warning("Invalid download link JSON for %s: %s", opportunity_id, exc)
             return None
 
         location = payload.get("location")
         if not location:
             return None
 
-        file_response = api_context.get(location, timeout=120_000)
-        if file_response.status >= 400:
-            LOGGER.warning(
-                "Attachment download failed with status %s for resource %s",
-                file_response.status,
-                resource_id,
-            )
+        resource_key = hashlib.sha1(",".join(sorted(resource_ids)).encode("utf-8")).hexdigest()
+        zip_path = self.downloads_dir / f"{opportunity_id}-{resource_key[:12]}.zip.part"
+        if fresh:
+            zip_path.unlink(missing_ok=True)
+        try:
+            self._stream_download(location, zip_path, label=f"attachment archive {opportunity_id}")
+        except Exception as exc:  # pylint: disable=broad-except
+            # The partial file is kept so the next attempt can resume it.
+            LOGGER.warning("Attachment download failed for %s: %s", opportunity_id, exc)
             return None
 
-        return file_response.body()
+        return zip_path
 
-    def _extract_zip_entries(
-        self,
-        zip_bytes: bytes,
-        destination_dir: Path,
-        preferred_name: Optional[str],
-        used_names: set[str],
-    ) -> List[Path]:
-        paths: List[Path] = []
-        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as archive:
+    def _api_get(self, url: str, *, label: str) -> Any:
+        """GET through the per-host rate limiter and retry policy."""
+
+        return self.request_policy.execute(
+            urlparse(url).netloc,
+            lambda: self.http_client.get(url, timeout=120_000),
+            label=label,
+        )
+
+    def _stream_download(self, url: str, path: Path, *, label: str) -> None:
+        """Stream ``url`` into ``path``, resuming from any bytes already there.
+
+        Retries after a dropped connection ask only for the missing range; the
+        client restarts from zero when the server does not support ranges or
+        rejects the range, and leaves a part file that was already whole alone.
+        """
+
+        with path.open("r+b" if path.exists() else "w+b") as handle:
+            handle.seek(0, os.SEEK_END)
+            start_size = handle.tell()
+
+            def stream() -> Any:
+                handle.seek(0, os.SEEK_END)
+                return self.http_client.stream_to(
+                    url,
+                    handle,
+                    timeout=120_000,
+                    chunk_size=DOWNLOAD_CHUNK_SIZE,
+                    resume=True,
+                )
+
+            try:
+                response = self.request_policy.execute(urlparse(url).netloc, stream, label=label)
+            finally:
+                handle.seek(0, os.SEEK_END)
+                # A restarted transfer may have shrunk the file below its start size.
+                self.request_policy.record(bytes_received=max(0, handle.tell() - start_size))
+            if response.status >= 400 and not response.already_complete:
+                handle.truncate(0)
+                raise RuntimeError(f"download returned status {response.status}")
+
+    def _extract_zip_entries(self, zip_path: Path) -> List[tuple[str, str, int]]:
+        """Store each archive member in the content store; return (name, sha256, size).
+
+        Members are CRC-checked as they are read, so a damaged archive raises
+        ``zipfile.BadZipFile``.
+        """
+
+        entries: List[tuple[str, str, int]] = []
+        with zipfile.ZipFile(zip_path) as archive:
             for info in archive.infolist():
                 if info.is_dir():
                     continue
-                data = archive.read(info)
-                inner_name = sanitize_filename(Path(info.filename).name)
-                if preferred_name:
-                    preferred = sanitize_filename(Path(preferred_name).name)
-                    if preferred:
-                        inner_name = preferred
-                if not inner_name:
-                    inner_name = "attachment"
-                unique_name = self._ensure_unique_filename(
-                    inner_name, destination_dir, used_names
-                )
-                output_path = destination_dir / unique_name
-                with output_path.open("wb") as handle:
-                    handle.write(data)
-                paths.append(output_path)
-        return paths
-
-    def _collect_attachments(
-        self,
-        api_context: APIRequestContext,
-        opportunity_id: str,
-        sam_url: str,
-        html: str,
-    ) -> List[AttachmentInfo]:
-        attachments = self._fetch_attachments_list(api_context, opportunity_id)
-        if attachments:
-            return attachments
-        return collect_attachments_from_html(html, sam_url)
+                with archive.open(info) as source:
+                    digest, size = self.content_store.put_stream(source)
+                entries.append((Path(info.filename).name, digest, size))
+        return entries
 
     @staticmethod
     def _nonce() -> int:
         return random.randint(1, 10**12)
 
+    def _update_state_index(self, results: List[OpportunityResult]) -> None:
+        for result in results:
+            self._record_state(result)
+        self.state_index.save()
+
+    def _record_state(self, result: OpportunityResult) -> None:
+        if result.status != "success" or not result.modified:
+            return
+        self.state_index.record(
+            result.metadata.opportunity_id,
+            {
+                "modified": result.modified,
+                "archived": result.archived,
+                "metadata": result.metadata.to_csv_row(),
+                "attachments": [
+                    self._attachment_record(attachment)
+                    for attachment in result.attachments
+                ],
+            },
+        )
+
     def _write_metadata(self, results: List[OpportunityResult]) -> None:
         metadata_path = self.metadata_dir / "sam-metadata.csv"
         existing = self._load_existing_metadata(metadata_path)
@@ -668,11 +2033,7 @@ class OpportunityScraper:
         for result in results:
             existing[result.metadata.sam_url] = result.metadata.to_csv_row()
 
-        with metadata_path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=METADATA_HEADERS)
-            writer.writeheader()
-            for sam_url in sorted(existing.keys()):
-                writer.writerow(existing[sam_url])
+        write_metadata_csv(metadata_path, existing)
 
     @staticmethod
     def _load_existing_metadata(path: Path) -> Dict[str, Dict[str, str]]:
@@ -693,7 +2054,26 @@ class OpportunityScraper:
             "output_dir": str(self.config.output_dir),
             "metadata_csv": str(self.metadata_dir / "sam-metadata.csv"),
             "attachments_dir": str(self.attachments_dir),
-            "opportunities": [self._manifest_entry(result) for result in results],
+            "http": {
+                **self.request_policy.stats.to_dict(),
+                "request_rates": self.request_policy.limiter.current_rates(),
+            },
+            # Per-opportunity details (timings, bytes, retries) are streamed to
+            # the JSONL manifest rather than repeated here.
+            "opportunities_manifest": str(self.run_manifest.path),
+            "counts": {
+                "opportunities": len(results),
+                "success": sum(1 for result in results if result.status == "success"),
+                "unchanged": sum(1 for result in results if result.unchanged),
+                "errors": sum(1 for result in results if result.status != "success"),
+                "pages_not_rendered": sum(1 for result in results if result.page_not_rendered),
+                "attachments_skipped": sum(
+                    1
+                    for result in results
+                    for attachment in result.attachments
+                    if attachment.skipped
+                ),
+            },
         }
 
         with manifest_path.open("w", encoding="utf-8") as handle:
@@ -706,23 +2086,108 @@ class OpportunityScraper:
             "sam_url": result.metadata.sam_url,
             "opportunity_id": result.metadata.opportunity_id,
             "status": result.status,
+            "unchanged": result.unchanged,
+            "modified": result.modified,
+            "page_not_rendered": result.page_not_rendered,
+            "archived": result.archived,
             "errors": result.errors,
             "metadata": result.metadata.to_csv_row(),
             "attachments": [
-                {
-                    "name": attachment.name,
-                    "url": attachment.url,
-                    "file_type": attachment.file_type,
-                    "size": attachment.size,
-                    "attachment_id": attachment.attachment_id,
-                    "resource_id": attachment.resource_id,
-                    "downloaded": bool(attachment.local_path and attachment.local_path.exists()),
-                    "local_path": _relative_path(attachment.local_path, self.config.output_dir),
-                }
-                for attachment in result.attachments
+                self._attachment_record(attachment) for attachment in result.attachments
             ],
         }
 
+    def _run_manifest_entry(self, result: OpportunityResult) -> Dict[str, Any]:
+        metadata = result.metadata
+        attachments = [
+            {
+                "name": attachment.name,
+                "size": attachment.size,
+                "bytes": _file_size(attachment.local_path),
+                "sha256": attachment.sha256,
+                "local_path": str(attachment.local_path) if attachment.local_path else None,
+                "skipped": attachment.skipped,
+                "history": attachment.history,
+            }
+            for attachment in result.attachments
+        ]
+        return {
+            "sam_url": metadata.sam_url,
+            "opportunity_id": metadata.opportunity_id,
+            "status": result.status,
+            "unchanged": result.unchanged,
+            "errors": result.errors,
+            "title": metadata.title,
+            "department": metadata.department,
+            "sub_tier": metadata.sub_tier,
+            "office": metadata.office,
+            "chain_id": metadata.chain_id,
+            "page_not_rendered": result.page_not_rendered,
+            "timings": result.timings,
+            "bytes_downloaded": result.http.get("bytes_received", 0),
+            "attachment_bytes": sum(item["bytes"] or 0 for item in attachments),
+            "http": {
+                key: result.http.get(key, 0)
+                for key in ("requests", "retries", "throttled_responses", "transient_errors", "throttled_seconds")
+            },
+            "attachments": attachments,
+        }
+
+    def _attachment_record(self, attachment: AttachmentInfo) -> Dict[str, Any]:
+        return {
+            "name": attachment.name,
+            "url": attachment.url,
+            "file_type": attachment.file_type,
+            "size": attachment.size,
+            "attachment_id": attachment.attachment_id,
+            "resource_id": attachment.resource_id,
+            "sha256": attachment.sha256,
+            "downloaded": bool(attachment.local_path and attachment.local_path.exists()),
+            "local_path": _relative_path(attachment.local_path, self.config.output_dir),
+            "skipped": attachment.skipped,
+            "history": attachment.history,
+        }
+
+    def _result_from_entry(self, entry: Dict[str, Any]) -> OpportunityResult:
+        metadata = OpportunityMetadata(
+            sam_url=entry["sam_url"],
+            opportunity_id=entry.get("opportunity_id") or parse_opportunity_id(entry["sam_url"]),
+        )
+        metadata.update(**entry.get("metadata", {}))
+        return OpportunityResult(
+            metadata=metadata,
+            attachments=[
+                self._attachment_from_record(record)
+                for record in entry.get("attachments", [])
+            ],
+            errors=list(entry.get("errors", [])),
+            status=entry.get("status", "success"),
+            unchanged=bool(entry.get("unchanged")),
+            modified=entry.get("modified") or "",
+            page_not_rendered=bool(entry.get("page_not_rendered")),
+            archived=bool(entry.get("archived")),
+        )
+
+    def _attachment_from_record(self, record: Dict[str, Any]) -> AttachmentInfo:
+        local_path = record.get("local_path")
+        path: Optional[Path] = None
+        if local_path:
+            path = Path(local_path)
+            if not path.is_absolute():
+                path = self.config.output_dir / path
+        return AttachmentInfo(
+            name=record.get("name") or "",
+            url=record.get("url") or "",
+            file_type=record.get("file_type"),
+            size=record.get("size"),
+            local_path=path,
+            attachment_id=record.get("attachment_id"),
+            resource_id=record.get("resource_id"),
+            sha256=record.get("sha256"),
+            skipped=record.get("skipped"),
+            history=record.get("history"),
+        )
+
 
 def parse_opportunity_id(sam_url: str) -> str:
     match = re.search(r"/opp/([a-zA-Z0-9]+)/", sam_url)
@@ -733,41 +2198,65 @@ def parse_opportunity_id(sam_url: str) -> str:
     return re.sub(r"[^A-Za-z0-9]+", "-", tail)
 
 
+def opportunity_modified_marker(opportunity: Optional[Dict[str, Any]]) -> str:
+    """Return the opportunity JSON's last-modified marker, or "" if it has none."""
+
+    if not opportunity:
+        return ""
+    details = opportunity.get("data2") or {}
+    for source in (opportunity, details):
+        for key in ("modifiedDate", "lastModifiedDate", "modified_date"):
+            value = source.get(key)
+            if value:
+                return stringify(value)
+    return ""
+
+
+TITLE_KEYS = ("title", "opportunitytitle", "noticetitle")
+DESCRIPTION_KEYS = ("description", "summary", "noticesummary")
+PUBLISHED_DATE_KEYS = ("publishdate", "publicationdate", "posteddate", "publish_date")
+RESPONSE_DATE_KEYS = ("responsedate", "responseduedate", "closedate", "responseclosedate")
+SET_ASIDE_KEYS = ("typeofsetaside", "setaside", "set_aside")
+NAICS_KEYS = ("naics", "naicscodes", "naics_code")
+PSC_KEYS = ("psc", "psccodes", "psc_code")
+PLACE_KEYS = ("placeofperformance", "place_of_performance")
+CONTACT_KEYS = ("contacts", "pointsofcontact", "primarycontact", "contact")
+HIERARCHY_KEYS = ("organizationhierarchy", "organizationhierarchydisplay")
+DEPARTMENT_KEYS = ("department", "agency", "agencyname")
+SUB_TIER_KEYS = ("subtier", "subagency")
+OFFICE_KEYS = ("office", "officename")
+
+
 def extract_metadata_from_payload(payload: Dict[str, Any]) -> Dict[str, str]:
+    index = build_field_index(payload)
     data: Dict[str, str] = {}
 
-    data["title"] = stringify(_find_first(payload, ["title", "opportunityTitle", "noticeTitle"]))
-    data["description"] = stringify(_find_first(payload, ["description", "summary", "noticeSummary"]))
-    data["published_date"] = stringify(
-        _find_first(payload, ["publishDate", "publicationDate", "postedDate", "publish_date"])
-    )
-    data["response_date"] = stringify(
-        _find_first(payload, ["responseDate", "responseDueDate", "closeDate", "responseCloseDate"])
-    )
-    data["set_aside"] = stringify(
-        _find_first(payload, ["typeOfSetAside", "setAside", "set_aside"])
-    )
+    data["title"] = stringify(lookup_field(index, TITLE_KEYS))
+    data["description"] = stringify(lookup_field(index, DESCRIPTION_KEYS))
+    data["published_date"] = stringify(lookup_field(index, PUBLISHED_DATE_KEYS))
+    data["response_date"] = stringify(lookup_field(index, RESPONSE_DATE_KEYS))
+    data["set_aside"] = stringify(lookup_field(index, SET_ASIDE_KEYS))
 
-    naics_value = _find_first(payload, ["naics", "naicsCodes", "naics_code"])
+    naics_value = lookup_field(index, NAICS_KEYS)
     data["naics"] = format_code_list(naics_value)
 
-    psc_value = _find_first(payload, ["psc", "pscCodes", "psc_code"])
+    psc_value = lookup_field(index, PSC_KEYS)
     data["psc"] = format_code_list(psc_value, code_keys=("psc", "pscCode", "code"))
 
-    place_value = _find_first(payload, ["placeOfPerformance", "place_of_performance"])
+    place_value = lookup_field(index, PLACE_KEYS)
     data["place_of_performance"] = format_place_of_performance(place_value)
 
-    contacts_value = _find_first(payload, ["contacts", "pointsOfContact", "primaryContact", "contact"])
+    contacts_value = lookup_field(index, CONTACT_KEYS)
     data["contact_information"] = format_contacts(contacts_value)
 
-    hierarchy = _find_first(payload, ["organizationHierarchy", "organizationHierarchyDisplay"])
+    hierarchy = lookup_field(index, HIERARCHY_KEYS)
     department, sub_tier, office = extract_organization_levels(hierarchy)
     if not department:
-        department = stringify(_find_first(payload, ["department", "agency", "agencyName"]))
+        department = stringify(lookup_field(index, DEPARTMENT_KEYS))
     if not sub_tier:
-        sub_tier = stringify(_find_first(payload, ["subTier", "subtier", "subAgency"]))
+        sub_tier = stringify(lookup_field(index, SUB_TIER_KEYS))
     if not office:
-        office = stringify(_find_first(payload, ["office", "officeName"]))
+        office = stringify(lookup_field(index, OFFICE_KEYS))
 
     data["department"] = department
     data["sub_tier"] = sub_tier
@@ -813,25 +2302,71 @@ def extract_metadata_from_api(
     )
     fields["contact_information"] = format_contacts(details.get("pointOfContact"))
 
-    department, sub_tier, office = extract_department_fields(organization)
-    fields["department"] = department
-    fields["sub_tier"] = sub_tier
-    fields["office"] = office
+    fields.update(extract_organization_fields(organization))
+    fields["chain_id"] = notice_chain_id(opportunity)
+
+    return {key: value for key, value in fields.items() if value}
 
+
+def extract_organization_fields(organization: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    department, sub_tier, office = extract_department_fields(organization)
+    fields = {"department": department, "sub_tier": sub_tier, "office": office}
     return {key: value for key, value in fields.items() if value}
 
 
-def extract_metadata_from_html(html: str) -> Dict[str, str]:
-    soup = BeautifulSoup(html, "html.parser")
+def notice_chain_id(opportunity: Dict[str, Any]) -> str:
+    """Identify the notice chain an opportunity payload belongs to.
+
+    Presolicitations, solicitations and their amendments are separate notices
+    sharing a solicitation number within an organization, so that pair keys
+    the chain. Notices without one fall back to their parent or related
+    notice, then to their own ID. Returns an empty string when the payload
+    identifies none of these.
+    """
+
+    details = opportunity.get("data2", {}) or {}
+    solicitation = re.sub(r"\s+", "", stringify(details.get("solicitationNumber"))).upper()
+    if solicitation:
+        basis = f"{stringify(details.get('organizationId'))}|{solicitation}"
+    else:
+        basis = next(
+            (
+                stringify(candidate)
+                for candidate in (
+                    (opportunity.get("parent") or {}).get("opportunityId"),
+                    (opportunity.get("related") or {}).get("opportunityId"),
+                    opportunity.get("opportunityId"),
+                )
+                if candidate
+            ),
+            "",
+        )
+    if not basis:
+        return ""
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()[:16]
+
+
+def parse_page(html: str) -> BeautifulSoup:
+    """Parse a scraped page once for both HTML extractors."""
+
+    return BeautifulSoup(html, HTML_PARSER, parse_only=PAGE_TAGS)
+
+
+def extract_metadata_from_html(html: Union[str, BeautifulSoup]) -> Dict[str, str]:
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(
+        html, HTML_PARSER, parse_only=SoupStrainer("meta")
+    )
     data: Dict[str, str] = {}
 
     title_meta = soup.select_one('meta[property="og:title"]') or soup.select_one('meta[name="twitter:title"]')
-    if title_meta and title_meta.get("content"):
-        data["title"] = title_meta.get("content").strip()
+    title = (title_meta.get("content") or "").strip() if title_meta else ""
+    if title and not GENERIC_PAGE_TITLE.match(title):
+        data["title"] = title
 
     desc_meta = soup.select_one('meta[name="description"]')
-    if desc_meta and desc_meta.get("content"):
-        data["description"] = desc_meta.get("content").strip()
+    description = (desc_meta.get("content") or "").strip() if desc_meta else ""
+    if description and not GENERIC_PAGE_DESCRIPTION.match(description):
+        data["description"] = description
 
     return data
 
@@ -839,7 +2374,7 @@ def extract_metadata_from_html(html: str) -> Dict[str, str]:
 def html_to_text(html: Optional[str]) -> str:
     if not html:
         return ""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     text = soup.get_text("\n")
     text = re.sub(r"\n{3,}", "\n\n", text)
     return text.strip()
@@ -1053,8 +2588,12 @@ ATTACHMENT_URL_KEYWORDS = ("download", "attachment", "document", "file", "docs")
 ATTACHMENT_EXTENSIONS = (".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".txt", ".csv", ".zip")
 
 
-def collect_attachments_from_html(html: str, page_url: str) -> List[AttachmentInfo]:
-    soup = BeautifulSoup(html, "html.parser")
+def collect_attachments_from_html(
+    html: Union[str, BeautifulSoup], page_url: str
+) -> List[AttachmentInfo]:
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(
+        html, HTML_PARSER, parse_only=SoupStrainer("a")
+    )
     attachments: List[AttachmentInfo] = []
     seen: set[tuple[str, str]] = set()
 
@@ -1089,6 +2628,83 @@ def collect_attachments_from_html(html: str, page_url: str) -> List[AttachmentIn
     return attachments
 
 
+def _block_nonessential(route: Route) -> None:
+    """Playwright route handler dropping images, fonts, styles and analytics."""
+
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_PATTERN.search(
+        request.url
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], stage: str) -> Iterator[None]:
+    """Add the wall time spent in the block to ``timings[stage]``."""
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - started
+
+
+def _file_size(path: Optional[Path]) -> Optional[int]:
+    try:
+        return path.stat().st_size if path else None
+    except OSError:
+        return None
+
+
+def _is_deleted_resource(record: Dict[str, Any]) -> bool:
+    """Whether a resources API entry describes a deleted file or link."""
+
+    flag = str(record.get("deletedFlag") or "").strip().lower()
+    return flag in ("1", "true", "y", "yes") or bool(record.get("deletedDate"))
+
+
+def _parse_posted_date(value: Any) -> Optional[datetime]:
+    """Parse a resources API ``postedDate`` (ISO 8601 or epoch milliseconds)."""
+
+    if value is None or value == "":
+        return None
+    try:
+        if isinstance(value, (int, float)) or str(value).strip().isdigit():
+            return datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc)
+        parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except (ValueError, OverflowError, OSError):
+        LOGGER.debug("Ignoring unparseable postedDate %r", value)
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _advertised_size(attachment: AttachmentInfo) -> Optional[int]:
+    """Byte size reported by the resources API, when it is a plain number."""
+
+    size = (attachment.size or "").strip()
+    return int(size) if size.isdigit() else None
+
+
+def _match_attachment(
+    entry_name: str, candidates: List[AttachmentInfo]
+) -> Optional[AttachmentInfo]:
+    """Find the listed attachment an archive entry belongs to by its real name."""
+
+    entry_key = sanitize_filename(entry_name).lower()
+    entry_stem = Path(entry_key).stem
+    for attachment in candidates:
+        if sanitize_filename(attachment.name).lower() == entry_key:
+            return attachment
+    # Some listings drop the extension that the stored file carries.
+    for attachment in candidates:
+        name_key = sanitize_filename(attachment.name).lower()
+        if name_key and (name_key == entry_stem or Path(name_key).stem == entry_stem):
+            return attachment
+    return None
+
+
 def _looks_like_attachment_url(url: str) -> bool:
     parsed = urlparse(url)
     if parsed.scheme not in ("http", "https"):
@@ -1131,14 +2747,43 @@ def _relative_path(path: Optional[Path], base: Path) -> Optional[str]:
         return str(path.resolve())
 
 
-def _find_first(obj: Any, keys: Iterable[str]) -> Any:
-    lowered = [key.lower() for key in keys]
-    for result in _iterate_nested(obj):
-        if isinstance(result, dict):
-            for key, value in result.items():
-                if key.lower() in lowered:
-                    return value
-    return None
+def build_field_index(obj: Any) -> Dict[str, tuple[int, Any]]:
+    """Walk a payload once and map each lowercase key to its first occurrence.
+
+    Positions follow the order a depth-first search visits dictionary items
+    (a dict's own items before its children's), so the entry with the lowest
+    position among several candidate keys is the first match a full scan of
+    the payload would find.
+    """
+
+    index: Dict[str, tuple[int, Any]] = {}
+    position = 0
+    stack: List[Any] = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(key, str):
+                    index.setdefault(key.lower(), (position, value))
+                position += 1
+            children = [value for value in node.values() if isinstance(value, (dict, list))]
+        elif isinstance(node, list):
+            children = [item for item in node if isinstance(item, (dict, list))]
+        else:
+            continue
+        stack.extend(reversed(children))
+    return index
+
+
+def lookup_field(index: Dict[str, tuple[int, Any]], keys: Iterable[str]) -> Any:
+    """Return the earliest value among ``keys`` (already lowercase) in ``index``."""
+
+    best: Optional[tuple[int, Any]] = None
+    for key in keys:
+        hit = index.get(key)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+    return best[1] if best is not None else None
 
 
 def _iterate_nested(obj: Any, depth: Optional[int] = None) -> Iterator[Any]:
@@ -6,16 +6,23 @@ import csv
 import io
 import json
 import logging
+import multiprocessing
+import os
+import queue
 import re
 import mimetypes
+import threading
 import zipfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
+from utils.content_store import sha256_file
 from utils.gemini import GeminiClient, GeminiSettings
+from utils.text_cache import DEFAULT_MAX_BYTES, ExtractedTextCache
 from utils.text_extraction import (
     SUPPORTED_EXTENSIONS,
     ExtractedDocument,
@@ -30,12 +37,20 @@ LOGGER = logging.getLogger(__name__)
 
 DOC_PROMPT_PATH = Path(__file__).resolve().parent / "SAMgov_Document_Summarization_Prompt.md"
 DOC_SUMMARIES_DIR_NAME = "doc_summaries"
+TEXT_CACHE_DIR = Path("cache") / "text"
 
 MAX_DIRECT_WORDS = 4500
 CHUNK_WORDS = 1800
 CHUNK_OVERLAP = 200
 CHUNK_SUMMARY_WORD_LIMIT = 180
 
+# Extracted documents waiting for a Gemini worker, per worker; bounds how far
+# extraction runs ahead of summarization (and how much text sits in memory).
+READY_QUEUE_PER_WORKER = 2
+# A crashed extraction worker breaks the whole pool; it is replaced this many
+# times before the remaining documents go straight to the file upload fallback.
+MAX_EXTRACTION_POOL_RESTARTS = 3
+
 CSV_HEADERS = [
     "sam-url",
     "opportunity_id",
@@ -46,6 +61,7 @@ CSV_HEADERS = [
     "summary",
     "model",
     "run_id",
+    "sha256",
 ]
 
 
@@ -55,6 +71,7 @@ class AttachmentTask:
     sam_url: str
     path: Path
     relative_path: Path
+    sha256: str = ""
 
 
 @dataclass
@@ -69,6 +86,7 @@ class DocumentSummary:
     model: str
     run_id: str
     error: Optional[str] = None
+    sha256: str = ""
 
     def to_csv_row(self) -> Dict[str, str]:
         return {
@@ -81,6 +99,7 @@ class DocumentSummary:
             "summary": self.summary,
             "model": self.model,
             "run_id": self.run_id,
+            "sha256": self.sha256,
         }
 
 
@@ -93,6 +112,9 @@ def summarize_documents(
     run_id: Optional[str],
     max_workers: int,
     skip_existing: bool,
+    extract_workers: Optional[int] = None,
+    use_text_cache: bool = True,
+    text_cache_max_bytes: int = DEFAULT_MAX_BYTES,
 ) -> None:
     attachments_dir = attachments_dir.resolve()
     output_dir = output_dir.resolve()
@@ -127,54 +149,66 @@ def summarize_documents(
     prompt_text = DOC_PROMPT_PATH.read_text(encoding="utf-8")
     run_identifier = run_id or datetime.utcnow().strftime("%Y%m%d-%H%M%S")
     settings = GeminiSettings(model=model)
+    text_cache = (
+        ExtractedTextCache(output_dir / TEXT_CACHE_DIR, max_bytes=text_cache_max_bytes)
+        if use_text_cache
+        else None
+    )
 
     results: List[DocumentSummary] = []
 
+    for task in tasks:
+        task.sha256 = sha256_file(task.path)
+
+    if skip_existing:
+        previous = _load_existing_summaries_by_hash(summaries_dir)
+        reused = [task for task in tasks if task.sha256 in previous]
+        for task in reused:
+            results.append(_copy_summary(previous[task.sha256], task, run_identifier))
+        tasks = [task for task in tasks if task.sha256 not in previous]
+        LOGGER.info("Reused %s summary(ies) for identical content", len(reused))
+
+    # Identical files (the same document attached to several notices) are
+    # summarized once and the result is copied to every occurrence.
+    unique_tasks: Dict[str, AttachmentTask] = {}
+    duplicates: List[AttachmentTask] = []
+    for task in tasks:
+        if task.sha256 in unique_tasks:
+            duplicates.append(task)
+        else:
+            unique_tasks[task.sha256] = task
+
+    extract_count = max(1, extract_workers or os.cpu_count() or 1)
+    llm_count = max(1, max_workers)
     LOGGER.info(
-        "Starting document summarization for %s attachment(s) with model %s",
-        len(tasks),
+        "Starting document summarization for %s attachment(s) (%s duplicate(s)) with model %s "
+        "(%s extraction process(es), %s Gemini worker(s))",
+        len(unique_tasks),
+        len(duplicates),
         model,
+        extract_count,
+        llm_count,
     )
 
-    worker_count = max(1, max_workers)
-    with ThreadPoolExecutor(max_workers=worker_count) as executor:
-        futures = {
-            executor.submit(
-                _summarize_single_attachment,
-                task,
-                settings,
-                prompt_text,
-                run_identifier,
-            ): task
-            for task in tasks
-        }
+    summaries_by_hash: Dict[str, DocumentSummary] = {}
+    outcomes = _run_summary_pipeline(
+        list(unique_tasks.values()),
+        settings=settings,
+        prompt_text=prompt_text,
+        run_id=run_identifier,
+        text_cache=text_cache,
+        extract_workers=extract_count,
+        llm_workers=llm_count,
+    )
+    for task, result in outcomes:
+        result.sha256 = task.sha256
+        results.append(result)
+        summaries_by_hash[task.sha256] = result
 
-        for future in as_completed(futures):
-            task = futures[future]
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as exc:  # pylint: disable=broad-except
-                LOGGER.exception(
-                    "Failed to summarize %s (%s): %s",
-                    task.path,
-                    task.opportunity_id,
-                    exc,
-                )
-                results.append(
-                    DocumentSummary(
-                        sam_url=task.sam_url,
-                        opportunity_id=task.opportunity_id,
-                        filename=task.path.name,
-                        filetype=task.path.suffix.lower().lstrip("."),
-                        local_path=str(task.relative_path),
-                        detected_doc_type="",
-                        summary="",
-                        model=model,
-                        run_id=run_identifier,
-                        error=str(exc),
-                    )
-                )
+    for task in duplicates:
+        source = summaries_by_hash.get(task.sha256)
+        if source is not None:
+            results.append(_copy_summary(source, task, run_identifier))
 
     timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
     sanitized_model = re.sub(r"[^A-Za-z0-9_-]+", "-", model)
@@ -195,10 +229,171 @@ def summarize_documents(
         success_count,
         error_count,
     )
+    if text_cache is not None:
+        LOGGER.info(
+            "Text cache: %s hit(s), %s extraction(s)", text_cache.hits, text_cache.misses
+        )
+
+
+def _run_summary_pipeline(
+    tasks: List[AttachmentTask],
+    *,
+    settings: GeminiSettings,
+    prompt_text: str,
+    run_id: str,
+    text_cache: Optional[ExtractedTextCache],
+    extract_workers: int,
+    llm_workers: int,
+) -> List[Tuple[AttachmentTask, DocumentSummary]]:
+    """Extract text in worker processes and summarize it in Gemini threads.
+
+    CPU-bound extraction would hold the GIL inside the Gemini threads, so it
+    runs in a process pool that feeds a bounded queue; ``llm_workers`` threads
+    take documents off the queue as soon as each is ready.
+    """
+
+    ready: "queue.Queue[Optional[Tuple[AttachmentTask, Union[ExtractedDocument, Exception]]]]" = (
+        queue.Queue(maxsize=llm_workers * READY_QUEUE_PER_WORKER)
+    )
+    outcomes: List[Tuple[AttachmentTask, DocumentSummary]] = []
+    lock = threading.Lock()
+
+    def summarize_ready() -> None:
+        while True:
+            item = ready.get()
+            if item is None:
+                return
+            task, extraction = item
+            try:
+                result = _summarize_single_attachment(
+                    task, extraction, settings, prompt_text, run_id
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.exception(
+                    "Failed to summarize %s (%s): %s",
+                    task.path,
+                    task.opportunity_id,
+                    exc,
+                )
+                result = DocumentSummary(
+                    sam_url=task.sam_url,
+                    opportunity_id=task.opportunity_id,
+                    filename=task.path.name,
+                    filetype=task.path.suffix.lower().lstrip("."),
+                    local_path=str(task.relative_path),
+                    detected_doc_type="",
+                    summary="",
+                    model=settings.model,
+                    run_id=run_id,
+                    error=str(exc),
+                )
+            with lock:
+                outcomes.append((task, result))
+
+    with ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix="summarize") as executor:
+        for _ in range(llm_workers):
+            executor.submit(summarize_ready)
+        try:
+            _extract_documents(tasks, ready, text_cache, extract_workers)
+        finally:
+            for _ in range(llm_workers):
+                ready.put(None)
+
+    return outcomes
+
+
+def _extract_documents(
+    tasks: List[AttachmentTask],
+    ready: "queue.Queue[Optional[Tuple[AttachmentTask, Union[ExtractedDocument, Exception]]]]",
+    text_cache: Optional[ExtractedTextCache],
+    workers: int,
+) -> None:
+    """Put each task's extracted text (or extraction error) on ``ready``.
+
+    Unsupported file types and cached text are queued directly; everything
+    else is extracted in a process pool with a bounded number of files in
+    flight, so a full queue holds back extraction instead of piling up
+    documents in memory. A pool broken by a crashed worker is replaced, up to
+    ``MAX_EXTRACTION_POOL_RESTARTS`` times.
+    """
+
+    pool: Optional[ProcessPoolExecutor] = _extraction_pool(workers)
+    restarts = 0
+    broken: Optional[BrokenProcessPool] = None
+    in_flight_limit = workers * 2
+    pending: Dict[Future, AttachmentTask] = {}
+    try:
+        for task in tasks:
+            extension = task.path.suffix.lower()
+            if extension not in SUPPORTED_EXTENSIONS:
+                ready.put(
+                    (task, UnsupportedFileTypeError(f"Unsupported file extension: {extension}"))
+                )
+                continue
+            cached = (
+                text_cache.get(task.sha256, task.path)
+                if text_cache is not None and task.sha256
+                else None
+            )
+            if cached is not None:
+                ready.put((task, cached))
+                continue
+            while len(pending) >= in_flight_limit:
+                _queue_finished_extractions(pending, ready, text_cache)
+            while pool is not None:
+                try:
+                    pending[pool.submit(extract_text, task.path)] = task
+                    break
+                except BrokenProcessPool as exc:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = None
+                    if restarts < MAX_EXTRACTION_POOL_RESTARTS:
+                        restarts += 1
+                        LOGGER.warning("Extraction worker crashed; restarting the pool: %s", exc)
+                        pool = _extraction_pool(workers)
+                    else:
+                        LOGGER.error(
+                            "Extraction pool broke %s times; uploading the remaining files instead",
+                            restarts + 1,
+                        )
+                        broken = exc
+            if pool is None:
+                ready.put((task, broken))
+        while pending:
+            _queue_finished_extractions(pending, ready, text_cache)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+def _extraction_pool(workers: int) -> ProcessPoolExecutor:
+    # Gemini threads are already running; spawned workers avoid forking them.
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _queue_finished_extractions(
+    pending: Dict[Future, AttachmentTask],
+    ready: "queue.Queue[Optional[Tuple[AttachmentTask, Union[ExtractedDocument, Exception]]]]",
+    text_cache: Optional[ExtractedTextCache],
+) -> None:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        task = pending.pop(future)
+        try:
+            extracted = future.result()
+        except Exception as exc:  # pylint: disable=broad-except
+            ready.put((task, exc))
+            continue
+        if text_cache is not None and task.sha256:
+            text_cache.put(task.sha256, extracted)
+        ready.put((task, extracted))
 
 
 def _summarize_single_attachment(
     task: AttachmentTask,
+    extraction: Union[ExtractedDocument, Exception],
     settings: GeminiSettings,
     prompt_text: str,
     run_id: str,
@@ -206,13 +401,11 @@ def _summarize_single_attachment(
     client = GeminiClient(settings)
     filetype = task.path.suffix.lower().lstrip(".")
 
-    try:
-        extracted = extract_text(task.path)
-    except UnsupportedFileTypeError as exc:
+    if isinstance(extraction, UnsupportedFileTypeError):
         LOGGER.info(
             "Falling back to Gemini file upload for unsupported file %s: %s",
             task.path,
-            exc,
+            extraction,
         )
         return _summarize_with_file_upload(
             task=task,
@@ -220,15 +413,16 @@ def _summarize_single_attachment(
             prompt_text=prompt_text,
             run_id=run_id,
         )
-    except Exception as exc:  # pylint: disable=broad-except
-        LOGGER.exception("Failed to extract text from %s", task.path)
+    if isinstance(extraction, Exception):
+        LOGGER.error("Failed to extract text from %s", task.path, exc_info=extraction)
         return _summarize_with_file_upload(
             task=task,
             settings=settings,
             prompt_text=prompt_text,
             run_id=run_id,
-            fallback_error=f"extraction_error: {exc}",
+            fallback_error=f"extraction_error: {extraction}",
         )
+    extracted = extraction
 
     if not extracted.text:
         LOGGER.warning("No text extracted from %s", task.path)
@@ -611,6 +805,48 @@ def _discover_attachment_tasks(
     return tasks
 
 
+def _copy_summary(
+    source: DocumentSummary, task: AttachmentTask, run_id: str
+) -> DocumentSummary:
+    return replace(
+        source,
+        sam_url=task.sam_url,
+        opportunity_id=task.opportunity_id,
+        filename=task.path.name,
+        filetype=task.path.suffix.lower().lstrip("."),
+        local_path=str(task.relative_path),
+        run_id=run_id,
+        sha256=task.sha256,
+    )
+
+
+def _load_existing_summaries_by_hash(directory: Path) -> Dict[str, DocumentSummary]:
+    summaries: Dict[str, DocumentSummary] = {}
+    if not directory.exists():
+        return summaries
+
+    for csv_path in sorted(directory.glob("doc-summaries-*.csv")):
+        with csv_path.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.DictReader(handle)
+            for row in reader:
+                digest = row.get("sha256") or ""
+                if not digest or not row.get("summary"):
+                    continue
+                summaries[digest] = DocumentSummary(
+                    sam_url=row.get("sam-url", ""),
+                    opportunity_id=row.get("opportunity_id", ""),
+                    filename=row.get("filename", ""),
+                    filetype=row.get("filetype", ""),
+                    local_path=row.get("local_path", ""),
+                    detected_doc_type=row.get("detected_doc_type", ""),
+                    summary=row.get("summary", ""),
+                    model=row.get("model", ""),
+                    run_id=row.get("run_id", ""),
+                    sha256=digest,
+                )
+    return summaries
+
+
 def _load_existing_summary_keys(directory: Path) -> set[tuple[str, str]]:
     keys: set[tuple[str, str]] = set()
     if not directory.exists():
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import logging
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -25,8 +26,14 @@ CSV_HEADERS = [
     "govbeacon-short-summary",
     "model",
     "run_id",
+    "chain_id",
+    "input_sha256",
 ]
 
+# Identify a notice rather than describe it; left out of prompts and, apart
+# from the chain, out of the input fingerprint.
+IDENTITY_FIELDS = ("sam-url", "opportunity_id", "chain_id")
+
 
 @dataclass
 class OpportunityData:
@@ -44,6 +51,8 @@ class OpportunitySummary:
     model: str
     run_id: str
     error: Optional[str] = None
+    chain_id: str = ""
+    input_sha256: str = ""
 
     def to_csv_row(self) -> Dict[str, str]:
         return {
@@ -52,6 +61,8 @@ class OpportunitySummary:
             "govbeacon-short-summary": self.short_summary,
             "model": self.model,
             "run_id": self.run_id,
+            "chain_id": self.chain_id,
+            "input_sha256": self.input_sha256,
         }
 
 
@@ -63,6 +74,7 @@ def summarize_opportunities(
     model: str,
     run_id: Optional[str],
     max_workers: int,
+    skip_existing: bool = False,
 ) -> None:
     output_dir = output_dir.resolve()
     summaries_dir = output_dir / OPP_SUMMARIES_DIR_NAME
@@ -77,14 +89,54 @@ def summarize_opportunities(
         LOGGER.warning("No opportunities found to summarize")
         return
 
+    fingerprints = {
+        opportunity.opportunity_id: _input_fingerprint(opportunity, model, prompt_text)
+        for opportunity in opportunities
+    }
+    results: List[OpportunitySummary] = []
+
+    if skip_existing:
+        previous = _load_existing_summaries_by_input(summaries_dir)
+        reused = [
+            opportunity
+            for opportunity in opportunities
+            if fingerprints[opportunity.opportunity_id] in previous
+        ]
+        for opportunity in reused:
+            results.append(
+                _copy_summary(
+                    previous[fingerprints[opportunity.opportunity_id]],
+                    opportunity,
+                    run_identifier,
+                )
+            )
+        opportunities = [
+            opportunity
+            for opportunity in opportunities
+            if fingerprints[opportunity.opportunity_id] not in previous
+        ]
+        LOGGER.info("Reused %s summary(ies) with unchanged inputs", len(reused))
+
+    # Notices of one chain whose metadata and documents match (apart from
+    # their IDs) are summarized once and the result copied to the others.
+    unique: Dict[str, OpportunityData] = {}
+    duplicates: List[OpportunityData] = []
+    for opportunity in opportunities:
+        fingerprint = fingerprints[opportunity.opportunity_id]
+        if fingerprint in unique:
+            duplicates.append(opportunity)
+        else:
+            unique[fingerprint] = opportunity
+
     LOGGER.info(
-        "Generating opportunity summaries for %s item(s) using model %s",
-        len(opportunities),
+        "Generating opportunity summaries for %s item(s) (%s identical chain notice(s)) using model %s",
+        len(unique),
+        len(duplicates),
         model,
     )
 
-    results: List[OpportunitySummary] = []
     worker_count = max(1, max_workers)
+    summaries_by_input: Dict[str, OpportunitySummary] = {}
 
     with ThreadPoolExecutor(max_workers=worker_count) as executor:
         futures = {
@@ -94,28 +146,37 @@ def summarize_opportunities(
                 settings,
                 prompt_text,
                 run_identifier,
-            ): opportunity
-            for opportunity in opportunities
+            ): fingerprint
+            for fingerprint, opportunity in unique.items()
         }
 
         for future in as_completed(futures):
-            opportunity = futures[future]
+            fingerprint = futures[future]
+            opportunity = unique[fingerprint]
             try:
-                results.append(future.result())
+                result = future.result()
             except Exception as exc:  # pylint: disable=broad-except
                 LOGGER.exception(
                     "Failed to summarize opportunity %s", opportunity.sam_url
                 )
-                results.append(
-                    OpportunitySummary(
-                        sam_url=opportunity.sam_url,
-                        long_summary="",
-                        short_summary="",
-                        model=model,
-                        run_id=run_identifier,
-                        error=str(exc),
-                    )
+                result = OpportunitySummary(
+                    sam_url=opportunity.sam_url,
+                    long_summary="",
+                    short_summary="",
+                    model=model,
+                    run_id=run_identifier,
+                    error=str(exc),
                 )
+            result.chain_id = opportunity.metadata.get("chain_id", "")
+            result.input_sha256 = fingerprint
+            results.append(result)
+            if not result.error:
+                summaries_by_input[fingerprint] = result
+
+    for opportunity in duplicates:
+        source = summaries_by_input.get(fingerprints[opportunity.opportunity_id])
+        if source is not None:
+            results.append(_copy_summary(source, opportunity, run_identifier))
 
     timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
     sanitized_model = re.sub(r"[^A-Za-z0-9_-]+", "-", model)
@@ -177,7 +238,7 @@ def _build_opportunity_prompt(opportunity: OpportunityData) -> str:
     lines: List[str] = []
     lines.append("Opportunity Metadata:")
     for key, value in opportunity.metadata.items():
-        if not value:
+        if not value or key == "chain_id":
             continue
         pretty_key = key.replace("_", " ").title()
         lines.append(f"- {pretty_key}: {value}")
@@ -199,6 +260,73 @@ def _build_opportunity_prompt(opportunity: OpportunityData) -> str:
     return "\n".join(lines)
 
 
+def _input_fingerprint(opportunity: OpportunityData, model: str, prompt_text: str) -> str:
+    """Hash everything that shapes a summary except which notice it is for.
+
+    The chain ID (or, outside a chain, the opportunity ID) is kept so only
+    re-runs and notices of the same chain share summaries.
+    """
+
+    neutral = OpportunityData(
+        sam_url="",
+        opportunity_id="",
+        metadata={
+            key: value
+            for key, value in opportunity.metadata.items()
+            if key not in IDENTITY_FIELDS
+        },
+        documents=sorted(
+            opportunity.documents,
+            key=lambda document: (document.get("filename", ""), document.get("sha256", "")),
+        ),
+    )
+    digest = hashlib.sha256()
+    for part in (
+        model,
+        prompt_text,
+        opportunity.metadata.get("chain_id") or opportunity.opportunity_id,
+        _build_opportunity_prompt(neutral),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _copy_summary(
+    source: OpportunitySummary, opportunity: OpportunityData, run_id: str
+) -> OpportunitySummary:
+    return replace(
+        source,
+        sam_url=opportunity.sam_url,
+        run_id=run_id,
+        chain_id=opportunity.metadata.get("chain_id", ""),
+    )
+
+
+def _load_existing_summaries_by_input(directory: Path) -> Dict[str, OpportunitySummary]:
+    summaries: Dict[str, OpportunitySummary] = {}
+    if not directory.exists():
+        return summaries
+
+    for csv_path in sorted(directory.glob("sam-summary-*.csv")):
+        with csv_path.open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.DictReader(handle)
+            for row in reader:
+                digest = row.get("input_sha256") or ""
+                if not digest or not row.get("govbeacon-long-summary"):
+                    continue
+                summaries[digest] = OpportunitySummary(
+                    sam_url=row.get("sam-url", ""),
+                    long_summary=row.get("govbeacon-long-summary", ""),
+                    short_summary=row.get("govbeacon-short-summary", ""),
+                    model=row.get("model", ""),
+                    run_id=row.get("run_id", ""),
+                    chain_id=row.get("chain_id", ""),
+                    input_sha256=digest,
+                )
+    return summaries
+
+
 def _split_long_short(response: str) -> tuple[str, str]:
     """Extract full and short summaries from response.
     
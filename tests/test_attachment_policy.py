@@ -0,0 +1,24 @@
+from utils.attachment_policy import AdmissionPolicy, attachment_type
+
+
+PDF_ONLY = AdmissionPolicy(allowed_types=frozenset({".pdf"}))
+
+
+def test_dotted_date_name_uses_reported_type():
+    assert attachment_type("Amendment dated 11.4.25", "application/pdf") == ".pdf"
+    assert PDF_ONLY.check("Amendment dated 11.4.25", "application/pdf") is None
+
+
+def test_dotted_date_name_without_type_is_admitted():
+    assert attachment_type("Amendment dated 11.4.25") == ""
+    assert PDF_ONLY.check("Amendment dated 11.4.25") is None
+
+
+def test_reported_type_wins_over_suffix():
+    assert PDF_ONLY.check("Draft RFP_11.4.25.pdf", "application/pdf") is None
+    assert PDF_ONLY.check("Pricing.pdf", "application/vnd.ms-excel") == "type .xls not allowed"
+
+
+def test_suffix_used_when_type_missing_or_generic():
+    assert PDF_ONLY.check("Draft RFP_11.4.25.pdf") is None
+    assert PDF_ONLY.check("Pricing.XLSX", "application/octet-stream") == "type .xlsx not allowed"
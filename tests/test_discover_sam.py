@@ -0,0 +1,96 @@
+import threading
+from datetime import date
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from discover_sam import DiscoveryState, OpportunityDiscovery, OpportunitySearch, SearchFilters
+from utils.http_client import SessionHttpClient
+from utils.rate_limit import AdaptiveRateLimiter, RequestPolicy
+
+
+SEARCH_URL = "http://search.test/opportunities/v2/search"
+
+
+class SearchStub:
+    """Serve a fixed notice list in pages, recording each requested offset."""
+
+    def __init__(self, notices):
+        self.notices = notices
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        params = parse_qs(urlparse(str(request.url)).query)
+        offset = int(params["offset"][0])
+        limit = int(params["limit"][0])
+        with self._lock:
+            self.requests.append((offset, threading.current_thread().name))
+        return httpx.Response(
+            200,
+            json={
+                "totalRecords": len(self.notices),
+                "opportunitiesData": self.notices[offset : offset + limit],
+            },
+        )
+
+
+def notice(notice_id, posted):
+    return {"noticeId": notice_id, "title": f"Notice {notice_id}", "postedDate": posted}
+
+
+def make_discovery(stub, state_path):
+    search = OpportunitySearch(
+        search_url=SEARCH_URL,
+        page_size=2,
+        concurrency=2,
+        request_policy=RequestPolicy(limiter=AdaptiveRateLimiter(rate=1000)),
+        http_client=SessionHttpClient(None, transport=httpx.MockTransport(stub)),
+    )
+    filters = SearchFilters(posted_to=date(2024, 1, 10))
+    return OpportunityDiscovery(search=search, filters=filters, state=DiscoveryState(state_path))
+
+
+def test_pages_are_fetched_concurrently_and_yielded_in_order(tmp_path):
+    stub = SearchStub([notice(f"n{i}", "2024-01-0%d" % (i + 1)) for i in range(5)])
+    discovery = make_discovery(stub, tmp_path / "state.json")
+
+    rows = list(discovery.iter_rows())
+
+    assert [row["notice_id"] for row in rows] == ["n0", "n1", "n2", "n3", "n4"]
+    assert rows[0]["sam-url"] == "https://sam.gov/opp/n0/view"
+    assert sorted(offset for offset, _ in stub.requests) == [0, 2, 4]
+    # The first page is fetched by the caller; the rest fan out to the executor.
+    threads = dict(stub.requests)
+    assert not threads[0].startswith("discover")
+    assert threads[2].startswith("discover") and threads[4].startswith("discover")
+
+
+def test_high_water_mark_skips_notices_seen_on_an_earlier_run(tmp_path):
+    state_path = tmp_path / "state.json"
+    notices = [
+        notice("a", "2024-01-02"),
+        notice("b", "2024-01-03"),
+        notice("c", "2024-01-03"),
+    ]
+    first = make_discovery(SearchStub(notices), state_path)
+    assert [row["notice_id"] for row in first.iter_rows()] == ["a", "b", "c"]
+    first.commit()
+
+    assert DiscoveryState(state_path).get(first.filters.key()) == {
+        "posted_date": "2024-01-03",
+        "notice_ids": ["b", "c"],
+    }
+
+    # The search API filters by day, so the second run starts on the
+    # watermark day and sees "b" and "c" again alongside the new notices.
+    stub = SearchStub(notices[1:] + [notice("d", "2024-01-03"), notice("e", "2024-01-04")])
+    second = make_discovery(stub, state_path)
+    assert second.filters.posted_from == date(2024, 1, 3)
+    assert [row["notice_id"] for row in second.iter_rows()] == ["d", "e"]
+    second.commit()
+
+    assert DiscoveryState(state_path).get(second.filters.key()) == {
+        "posted_date": "2024-01-04",
+        "notice_ids": ["e"],
+    }
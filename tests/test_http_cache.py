@@ -0,0 +1,69 @@
+import threading
+import time
+
+from utils.http_cache import ResponseCache, cache_key_for_url
+
+
+def test_cache_key_drops_cache_busting_parameter():
+    assert cache_key_for_url("https://sam.gov/api/x?api_key=null&random=123") == cache_key_for_url(
+        "https://sam.gov/api/x?api_key=null&random=456"
+    )
+
+
+def test_entries_expire_after_their_ttl(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return {"value": len(fetches)}
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    assert cache.get_or_fetch("key", 60, fetch) == {"value": 1}
+    assert cache.get_or_fetch("key", 60, fetch) == {"value": 1}
+
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get_or_fetch("key", 60, fetch) == {"value": 2}
+    # A longer TTL for the same key still accepts the refreshed entry.
+    assert cache.get_or_fetch("key", 3600, fetch) == {"value": 2}
+
+
+def test_failed_fetches_are_not_cached(tmp_path):
+    cache = ResponseCache(tmp_path)
+    results = iter([None, {"ok": True}])
+
+    assert cache.get_or_fetch("key", 60, lambda: next(results)) is None
+    assert cache.get_or_fetch("key", 60, lambda: next(results)) == {"ok": True}
+
+
+def test_concurrent_fetches_of_one_key_are_coalesced(tmp_path):
+    cache = ResponseCache(tmp_path)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": "shared"}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get_or_fetch("key", 60, fetch)))
+    leader.start()
+    started.wait(5)
+    followers = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch("key", 60, fetch)))
+        for _ in range(3)
+    ]
+    for thread in followers:
+        thread.start()
+    # Followers find the in-flight fetch rather than a cache entry.
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [{"value": "shared"}] * 4
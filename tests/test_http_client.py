@@ -0,0 +1,99 @@
+import io
+
+import httpx
+import pytest
+
+from utils.http_client import IncompleteDownloadError, SessionHttpClient
+
+
+BODY = bytes(range(256)) * 4
+URL = "http://files.test/archive.zip"
+
+
+def range_server(*, honour_ranges=True, truncate_at=None, unsatisfiable_total=None):
+    """Serve ``BODY`` with optional Range support, recording request headers."""
+
+    requests = []
+
+    def handler(request):
+        requests.append(request.headers.get("range"))
+        header = request.headers.get("range")
+        if header and honour_ranges:
+            start = int(header[len("bytes=") : -1])
+            if start >= len(BODY):
+                total = len(BODY) if unsatisfiable_total is None else unsatisfiable_total
+                return httpx.Response(416, headers={"content-range": f"bytes */{total}"})
+            return httpx.Response(
+                206,
+                headers={"content-range": f"bytes {start}-{len(BODY) - 1}/{len(BODY)}"},
+                content=BODY[start:],
+            )
+        if truncate_at is not None:
+            # Advertise the full length but end the body early.
+            return httpx.Response(
+                200,
+                headers={"content-length": str(len(BODY))},
+                stream=httpx.ByteStream(BODY[:truncate_at]),
+            )
+        return httpx.Response(200, content=BODY)
+
+    return requests, handler
+
+
+def stream(handler, handle):
+    client = SessionHttpClient(None, transport=httpx.MockTransport(handler))
+    handle.seek(0, io.SEEK_END)
+    return client.stream_to(URL, handle, resume=True)
+
+
+def test_partial_file_resumes_from_its_end():
+    requests, handler = range_server()
+    handle = io.BytesIO(BODY[:300])
+
+    response = stream(handler, handle)
+
+    assert response.status == 206
+    assert requests == ["bytes=300-"]
+    assert handle.getvalue() == BODY
+
+
+def test_server_ignoring_range_restarts_from_zero():
+    _, handler = range_server(honour_ranges=False)
+    handle = io.BytesIO(b"stale" * 10)
+
+    response = stream(handler, handle)
+
+    assert response.status == 200
+    assert handle.getvalue() == BODY
+
+
+def test_416_for_a_complete_file_is_treated_as_finished():
+    requests, handler = range_server()
+    handle = io.BytesIO(BODY)
+
+    response = stream(handler, handle)
+
+    assert response.status == 416 and response.already_complete
+    assert requests == [f"bytes={len(BODY)}-"]
+    assert handle.getvalue() == BODY
+
+
+def test_other_416_restarts_once_without_a_range():
+    requests, handler = range_server(unsatisfiable_total=10)
+    handle = io.BytesIO(BODY + b"extra")
+
+    response = stream(handler, handle)
+
+    assert response.status == 200 and not response.already_complete
+    assert requests == [f"bytes={len(BODY) + 5}-", None]
+    assert handle.getvalue() == BODY
+
+
+def test_short_body_raises_and_keeps_received_bytes():
+    _, handler = range_server(truncate_at=100)
+    handle = io.BytesIO()
+
+    with pytest.raises(IncompleteDownloadError):
+        stream(handler, handle)
+
+    assert handle.getvalue() == BODY[:100]
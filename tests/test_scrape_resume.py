@@ -0,0 +1,83 @@
+import httpx
+import pytest
+
+import scrape_sam
+
+
+class SamStub:
+    """Answer every SAM API call, recording which opportunities were fetched."""
+
+    def __init__(self):
+        self.opportunities = []
+
+    def __call__(self, request):
+        url = str(request.url)
+        if "/resources" in url:
+            return httpx.Response(200, json={"_embedded": {"opportunityAttachmentList": []}})
+        if "/opps/v2/opportunities/" in url:
+            opportunity_id = request.url.path.rsplit("/", 1)[-1]
+            self.opportunities.append(opportunity_id)
+            return httpx.Response(
+                200,
+                json={
+                    "data2": {"title": f"Title {opportunity_id}"},
+                    "description": [{"body": "Description"}],
+                    "modifiedDate": "2024-01-01",
+                },
+            )
+        return httpx.Response(200, json={})
+
+
+class SessionStub:
+    def load_storage_state(self):
+        return {}
+
+
+@pytest.fixture
+def sam(monkeypatch):
+    stub = SamStub()
+    monkeypatch.setattr(
+        scrape_sam, "build_fixture_transport", lambda **_: httpx.MockTransport(stub)
+    )
+    return stub
+
+
+def scrape(tmp_path, ids, **options):
+    input_csv = tmp_path / "input.csv"
+    input_csv.write_text(
+        "sam-url\n" + "".join(f"https://sam.gov/opp/{i}/view\n" for i in ids),
+        encoding="utf-8",
+    )
+    config = scrape_sam.ScrapeConfig(
+        input_csv=input_csv,
+        output_dir=tmp_path / "out",
+        use_cache=False,
+        request_rate=1000,
+        **options,
+    )
+    results = scrape_sam.OpportunityScraper(config=config, session_manager=SessionStub()).run()
+    return {result.metadata.opportunity_id: result.status for result in results}
+
+
+def test_resume_only_scrapes_rows_missing_from_the_journal(tmp_path, sam):
+    assert scrape(tmp_path, ["a1", "b2"]) == {"a1": "success", "b2": "success"}
+    sam.opportunities.clear()
+
+    assert scrape(tmp_path, ["a1", "b2", "c3"], resume=True) == {
+        "a1": "success",
+        "b2": "success",
+        "c3": "success",
+    }
+    assert sam.opportunities == ["c3"]
+
+
+def test_resume_ignores_journal_entries_outside_the_input(tmp_path, sam):
+    scrape(tmp_path, ["a1", "b2", "c3"])
+    sam.opportunities.clear()
+
+    assert scrape(tmp_path, ["a1"], resume=True, concurrency=4) == {"a1": "success"}
+    assert scrape(tmp_path, ["a1", "d4"], resume=True, concurrency=4) == {
+        "a1": "success",
+        "d4": "success",
+    }
+    assert sam.opportunities == ["d4"]
@@ -0,0 +1,63 @@
+import random
+
+from utils.text_extraction import _WHITESPACE_RULES, _normalize_whitespace, extract_text
+
+
+def reference_normalize(text, offsets):
+    """Straightforward per-offset version of ``_normalize_whitespace``."""
+
+    for pattern, replacement in _WHITESPACE_RULES:
+        matches = list(pattern.finditer(text))
+        shifted = []
+        for offset in offsets:
+            delta = 0
+            for match in matches:
+                if match.end() <= offset:
+                    delta += len(replacement) - (match.end() - match.start())
+                elif match.start() < offset:
+                    offset = match.start() + len(replacement)
+                    break
+            shifted.append(offset + delta)
+        text = pattern.sub(replacement, text)
+        offsets = shifted
+    stripped = text.strip()
+    leading = len(text) - len(text.lstrip())
+    return stripped, [min(max(offset - leading, 0), len(stripped)) for offset in offsets]
+
+
+def test_offsets_follow_collapsed_runs():
+    text = "one\t\ttwo\n\n\n\nthree\rfour"
+    offsets = [0, 3, 4, 8, 10, 12]
+
+    normalized, shifted = _normalize_whitespace(text, offsets)
+
+    assert normalized == "one two\n\nthree four"
+    # Offsets inside a collapsed run land just past its replacement.
+    assert shifted == [0, 3, 4, 7, 9, 9]
+    assert normalized[shifted[-1] :].startswith("three")
+
+
+def test_leading_whitespace_is_stripped_from_offsets():
+    normalized, shifted = _normalize_whitespace("\n\n\n\ttitle\n\n\nbody  ", [0, 4, 9, 12])
+
+    assert normalized == "title\n\nbody"
+    assert shifted == [0, 0, 5, 7]
+
+
+def test_matches_reference_on_random_text():
+    rng = random.Random(24)
+    alphabet = "ab \t\r\n"
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        offsets = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 6)))
+        assert _normalize_whitespace(text, offsets) == reference_normalize(text, offsets)
+
+
+def test_txt_page_offsets_start_at_zero(tmp_path):
+    path = tmp_path / "notice.txt"
+    path.write_text("\n\nStatement\t\tof work\n\n\n\nSection 2", encoding="utf-8")
+
+    document = extract_text(path)
+
+    assert document.text == "Statement of work\n\nSection 2"
+    assert document.page_offsets == [0]
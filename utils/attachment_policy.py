@@ -0,0 +1,127 @@
+"""Decide which SAM.gov attachments are worth downloading and summarizing."""
+
+from __future__ import annotations
+
+import json
+import logging
+import mimetypes
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import FrozenSet, Iterable, Optional, Pattern, Tuple
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Boilerplate attached to many notices that carries nothing worth summarizing.
+DEFAULT_BLOCKED_NAMES = (
+    r"PIEE Solicitation Module Link",
+    r"Procurement Toolbox",
+)
+
+# MIME types that say nothing about the format; the file name is used instead.
+GENERIC_MIME_TYPES = frozenset({"application/octet-stream", "binary/octet-stream"})
+
+
+def normalize_type(value: str) -> str:
+    """Reduce a file extension or MIME type to a lowercase ``.ext`` form."""
+
+    candidate = value.strip().lower()
+    if not candidate:
+        return ""
+    if "/" in candidate:
+        return mimetypes.guess_extension(candidate) or ""
+    if not candidate.startswith("."):
+        candidate = f".{candidate}"
+    return candidate
+
+
+def attachment_type(name: str, file_type: Optional[str] = None) -> str:
+    """Return the ``.ext`` type of an attachment, or "" when it is unknown.
+
+    The type reported by the API wins. The name's suffix is only a fallback,
+    and only when it is a known extension: titles such as "Amendment dated
+    11.4.25" end in something that merely looks like one.
+    """
+
+    reported = (file_type or "").strip().lower()
+    if reported and reported not in GENERIC_MIME_TYPES:
+        extension = normalize_type(reported)
+        if extension:
+            return extension
+    suffix = Path(name or "").suffix.lower()
+    return suffix if suffix in mimetypes.types_map else ""
+
+
+def compile_patterns(patterns: Iterable[str]) -> Tuple[Pattern[str], ...]:
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+
+@dataclass
+class AdmissionPolicy:
+    """Size, type and fingerprint limits applied to attachments.
+
+    Names, types and advertised sizes are checked before anything is
+    downloaded; content hashes (and sizes the listing did not report) can
+    only be checked once the bytes are in hand. Each check returns the reason
+    an attachment is skipped, or None when it is admitted.
+    """
+
+    max_bytes: Optional[int] = None
+    allowed_types: Optional[FrozenSet[str]] = None
+    blocked_names: Tuple[Pattern[str], ...] = field(
+        default_factory=lambda: compile_patterns(DEFAULT_BLOCKED_NAMES)
+    )
+    blocked_sha256: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_file(cls, path: Path, *, max_bytes: Optional[int] = None) -> "AdmissionPolicy":
+        """Load a JSON policy file.
+
+        Recognised keys are ``max_bytes``, ``allowed_types`` (extensions or
+        MIME types), ``blocked_names`` (case-insensitive regular expressions,
+        replacing the defaults) and ``blocked_sha256``. An explicit
+        ``max_bytes`` argument overrides the file.
+        """
+
+        with path.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+        allowed = data.get("allowed_types")
+        policy = cls(
+            max_bytes=max_bytes if max_bytes is not None else data.get("max_bytes"),
+            allowed_types=(
+                frozenset(filter(None, (normalize_type(item) for item in allowed)))
+                if allowed is not None
+                else None
+            ),
+            blocked_names=compile_patterns(data.get("blocked_names", DEFAULT_BLOCKED_NAMES)),
+            blocked_sha256=frozenset(item.lower() for item in data.get("blocked_sha256", [])),
+        )
+        LOGGER.info("Loaded attachment policy from %s", path)
+        return policy
+
+    def check(
+        self, name: str, file_type: Optional[str] = None, size: Optional[int] = None
+    ) -> Optional[str]:
+        """Return why a listed attachment should be skipped, or None to admit it."""
+
+        for pattern in self.blocked_names:
+            if pattern.search(name or ""):
+                return f"blocked name ({pattern.pattern})"
+        if self.max_bytes is not None and size is not None and size > self.max_bytes:
+            return f"too large ({size} bytes, limit {self.max_bytes})"
+        if self.allowed_types is not None:
+            extension = attachment_type(name, file_type)
+            # Attachments of unknown type are admitted rather than guessed at.
+            if extension and extension not in self.allowed_types:
+                return f"type {extension} not allowed"
+        return None
+
+    def check_content(self, digest: str, size: int) -> Optional[str]:
+        """Return why downloaded content should be discarded, or None to keep it."""
+
+        if digest in self.blocked_sha256:
+            return "blocked content hash"
+        if self.max_bytes is not None and size > self.max_bytes:
+            return f"too large ({size} bytes, limit {self.max_bytes})"
+        return None
@@ -0,0 +1,107 @@
+"""Content-addressed storage for downloaded SAM.gov attachments."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Tuple
+
+
+LOGGER = logging.getLogger(__name__)
+
+BLOBS_DIR_NAME = "blobs"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def sha256_file(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file, reading it in chunks."""
+
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentStore:
+    """Store each distinct file once, addressed by its SHA-256 digest.
+
+    Per-opportunity attachment directories hold hardlinks into the store, so a
+    document shared by several notices or fetched again on a re-scrape costs no
+    extra disk space.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put_bytes(self, data: bytes) -> str:
+        return self.put_stream(io.BytesIO(data))[0]
+
+    def put_stream(self, stream: BinaryIO) -> Tuple[str, int]:
+        """Copy a stream into the store and return its digest and size."""
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_name = tempfile.mkstemp(dir=self.root, prefix=".incoming-")
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    handle.write(chunk)
+                    size += len(chunk)
+            hex_digest = digest.hexdigest()
+            self._commit(temp_path, hex_digest)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return hex_digest, size
+
+    def link(self, digest: str, destination: Path) -> None:
+        """Expose a stored blob at ``destination`` via hardlink (copy as fallback)."""
+
+        blob = self.blob_path(digest)
+        if destination.exists():
+            if self.matches(digest, destination):
+                return
+            destination.unlink()
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(blob, destination)
+        except OSError as exc:
+            LOGGER.debug("Hardlink failed for %s (%s); copying instead", destination, exc)
+            shutil.copyfile(blob, destination)
+
+    def matches(self, digest: str, path: Path) -> bool:
+        """Return True when ``path`` already holds the content for ``digest``."""
+
+        if not path.is_file():
+            return False
+        blob = self.blob_path(digest)
+        try:
+            if blob.exists() and os.path.samefile(blob, path):
+                return True
+            if blob.exists() and blob.stat().st_size != path.stat().st_size:
+                return False
+        except OSError:
+            return False
+        return sha256_file(path) == digest
+
+    def _commit(self, temp_path: Path, digest: str) -> None:
+        blob = self.blob_path(digest)
+        if blob.exists():
+            return
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp creates owner-only files; match regular downloads instead.
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, blob)
+
@@ -0,0 +1,128 @@
+"""On-disk cache for JSON API responses with per-entry TTLs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_BUSTING_PARAMS = frozenset({"random"})
+
+
+def cache_key_for_url(url: str) -> str:
+    """Normalize a URL into a cache key by dropping cache-busting parameters."""
+
+    parsed = urlparse(url)
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if name not in CACHE_BUSTING_PARAMS
+    ]
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+class ResponseCache:
+    """Persist decoded JSON responses on disk and coalesce concurrent fetches.
+
+    Entries are keyed by normalized URL. Only successful responses are stored:
+    a fetch that returns ``None`` is treated as a failure and never cached.
+    Callers waiting on a key that another thread is already fetching receive
+    that thread's result instead of issuing a duplicate request.
+    """
+
+    def __init__(self, root: Path, *, enabled: bool = True) -> None:
+        self.root = root
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+    def get_or_fetch(
+        self,
+        key: str,
+        ttl_seconds: float,
+        fetch: Callable[[], Optional[Any]],
+    ) -> Optional[Any]:
+        if not self.enabled:
+            return fetch()
+
+        cached = self._read(key, ttl_seconds)
+        if cached is not None:
+            LOGGER.debug("Cache hit for %s", key)
+            return cached
+
+        with self._lock:
+            pending = self._in_flight.get(key)
+            if pending is None:
+                pending = Future()
+                self._in_flight[key] = pending
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            LOGGER.debug("Waiting on in-flight request for %s", key)
+            return pending.result()
+
+        try:
+            value = fetch()
+            if value is not None:
+                self._write(key, value)
+            pending.set_result(value)
+            return value
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def store(self, key: str, payload: Any) -> None:
+        """Record a response fetched outside ``get_or_fetch``."""
+
+        if self.enabled and payload is not None:
+            self._write(key, payload)
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def _read(self, key: str, ttl_seconds: float) -> Optional[Any]:
+        path = self._path_for(key)
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.debug("Ignoring unreadable cache entry %s: %s", path, exc)
+            return None
+
+        if entry.get("key") != key:
+            return None
+        if time.time() - float(entry.get("stored_at", 0)) > ttl_seconds:
+            return None
+        return entry.get("payload")
+
+    def _write(self, key: str, payload: Any) -> None:
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"key": key, "stored_at": time.time(), "payload": payload}
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle)
+            os.replace(temp_name, path)
+        except OSError as exc:
+            LOGGER.warning("Failed to write cache entry for %s: %s", key, exc)
+            Path(temp_name).unlink(missing_ok=True)
@@ -0,0 +1,244 @@
+"""Pooled HTTP client that reuses a saved Playwright SAM.gov session."""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+import httpx
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+
+def load_storage_state(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a Playwright ``storage_state`` JSON file, or None if it is missing."""
+
+    if not path.exists():
+        return None
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError) as exc:
+        LOGGER.warning("Ignoring unreadable session state %s: %s", path, exc)
+        return None
+
+
+def storage_state_expired(
+    storage_state: Optional[Dict[str, Any]], domain: str, *, now: Optional[float] = None
+) -> bool:
+    """Return True when no unexpired cookie for ``domain`` is left in the state.
+
+    Cookies Playwright saved without an expiry (``expires`` of -1) count as live;
+    only the server can tell whether they are still accepted.
+    """
+
+    now = time.time() if now is None else now
+    for cookie in (storage_state or {}).get("cookies", []):
+        cookie_domain = cookie.get("domain", "").lstrip(".")
+        if cookie_domain != domain and not cookie_domain.endswith(f".{domain}"):
+            continue
+        expires = cookie.get("expires", -1)
+        if expires is None or expires < 0 or expires > now:
+            return False
+    return True
+
+
+def cookies_from_storage_state(storage_state: Optional[Dict[str, Any]]) -> httpx.Cookies:
+    cookies = httpx.Cookies()
+    for cookie in (storage_state or {}).get("cookies", []):
+        name = cookie.get("name")
+        if not name:
+            continue
+        cookies.set(
+            name,
+            cookie.get("value", ""),
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+        )
+    return cookies
+
+
+class IncompleteDownloadError(IOError):
+    """The connection ended before the advertised number of bytes arrived."""
+
+
+class HttpResponse:
+    """Response wrapper exposing the subset of Playwright's APIResponse we use.
+
+    ``already_complete`` marks a resumed download whose file was already whole
+    (the server answered 416 for a range starting at its full length).
+    """
+
+    def __init__(self, response: httpx.Response, *, already_complete: bool = False) -> None:
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.already_complete = already_complete
+
+    def body(self) -> bytes:
+        return self._response.content
+
+    def text(self) -> str:
+        return self._response.text
+
+    def json(self) -> Any:
+        return self._response.json()
+
+
+class SessionHttpClient:
+    """Thread-safe keep-alive HTTP client carrying the SAM.gov session cookies.
+
+    ``get`` mirrors Playwright's ``APIRequestContext.get`` (timeouts in
+    milliseconds) so scraping code can issue API calls and downloads without a
+    browser. One instance is shared by all scrape workers.
+    """
+
+    def __init__(
+        self,
+        storage_state: Optional[Dict[str, Any]],
+        *,
+        max_connections: int = 20,
+        timeout_seconds: float = 120.0,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        self._client = httpx.Client(
+            cookies=cookies_from_storage_state(storage_state),
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=timeout_seconds,
+            follow_redirects=True,
+            transport=transport,
+        )
+
+    def get(
+        self,
+        url: str,
+        *,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> HttpResponse:
+        response = self._client.get(url, timeout=_seconds(timeout), headers=headers)
+        return HttpResponse(response)
+
+    def stream_to(
+        self,
+        url: str,
+        handle: BinaryIO,
+        *,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 1024 * 1024,
+        resume: bool = False,
+    ) -> HttpResponse:
+        """Write the body of a successful response to ``handle`` chunk by chunk.
+
+        With ``resume`` the bytes already in ``handle`` (up to its current
+        position) are kept and only the rest is requested with a Range header;
+        a server that ignores the range restarts the file from zero. A 416
+        whose ``Content-Range: */total`` equals the bytes already held means
+        the file is complete; any other 416 restarts the file once without a
+        range. When the response advertises its length, a short body raises
+        :class:`IncompleteDownloadError` with the received bytes left in place
+        for the next attempt. Error responses are returned without writing
+        anything so the caller can inspect the status.
+        """
+
+        offset = handle.tell() if resume else 0
+        request_headers = dict(headers or {})
+        if offset:
+            request_headers["Range"] = f"bytes={offset}-"
+
+        with self._client.stream(
+            "GET", url, timeout=_seconds(timeout), headers=request_headers
+        ) as response:
+            range_rejected = response.status_code == 416 and offset > 0
+            if range_rejected:
+                response.read()
+                if _unsatisfied_range_total(response) == offset:
+                    LOGGER.debug("%s was already complete at %s bytes", url, offset)
+                    return HttpResponse(response, already_complete=True)
+            elif response.status_code >= 400:
+                response.read()
+                return HttpResponse(response)
+            else:
+                return self._write_body(response, handle, url, offset, chunk_size)
+
+        LOGGER.debug("Range from byte %s rejected for %s; downloading from the start", offset, url)
+        handle.seek(0)
+        handle.truncate()
+        return self.stream_to(
+            url, handle, timeout=timeout, headers=headers, chunk_size=chunk_size
+        )
+
+    def _write_body(
+        self,
+        response: httpx.Response,
+        handle: BinaryIO,
+        url: str,
+        offset: int,
+        chunk_size: int,
+    ) -> HttpResponse:
+        if response.status_code == 206 and _content_range_start(response) == offset:
+            LOGGER.debug("Resuming %s at byte %s", url, offset)
+        else:
+            offset = 0
+        handle.seek(offset)
+        handle.truncate()
+
+        expected = _expected_length(response, offset)
+        for chunk in response.iter_bytes(chunk_size):
+            handle.write(chunk)
+        received = handle.tell()
+        if expected is not None and received < expected:
+            raise IncompleteDownloadError(
+                f"received {received} of {expected} bytes from {url}"
+            )
+        return HttpResponse(response)
+
+    def dispose(self) -> None:
+        self._client.close()
+
+
+def _unsatisfied_range_total(response: httpx.Response) -> Optional[int]:
+    match = re.match(r"bytes \*/(\d+)$", response.headers.get("content-range", "").strip())
+    return int(match.group(1)) if match else None
+
+
+def _content_range_start(response: httpx.Response) -> Optional[int]:
+    match = re.match(r"bytes (\d+)-", response.headers.get("content-range", ""))
+    return int(match.group(1)) if match else None
+
+
+def _expected_length(response: httpx.Response, offset: int) -> Optional[int]:
+    """Total file length implied by the response headers, if it can be trusted."""
+
+    if response.headers.get("content-encoding", "identity") != "identity":
+        # Lengths describe the encoded body, not the bytes written out.
+        return None
+    total = re.search(r"/(\d+)$", response.headers.get("content-range", ""))
+    if response.status_code == 206 and total:
+        return int(total.group(1))
+    length = response.headers.get("content-length")
+    if length and length.isdigit():
+        return offset + int(length)
+    return None
+
+
+def _seconds(timeout_ms: Optional[float]) -> Any:
+    if timeout_ms is None:
+        return httpx.USE_CLIENT_DEFAULT
+    return timeout_ms / 1000.0
@@ -0,0 +1,178 @@
+"""Record SAM.gov HTTP traffic to a fixture directory and replay it offline."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from utils.content_store import ContentStore
+from utils.http_cache import cache_key_for_url
+
+
+LOGGER = logging.getLogger(__name__)
+
+FIXTURE_INDEX_NAME = "index.json"
+FIXTURE_BODIES_DIR = "bodies"
+
+# Bodies are stored decoded, so transfer framing headers must not be replayed.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+
+def fixture_key(method: str, url: str) -> str:
+    return f"{method.upper()} {cache_key_for_url(url)}"
+
+
+class FixtureStore:
+    """Recorded responses keyed by method and normalized URL.
+
+    ``index.json`` maps each key to the status, headers and body digest of a
+    response; bodies live once each in a content-addressed ``bodies`` store.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.bodies = ContentStore(root / FIXTURE_BODIES_DIR)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        body = self.bodies.blob_path(entry["body"]).read_bytes()
+        return entry, body
+
+    def put(
+        self,
+        key: str,
+        *,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+    ) -> None:
+        digest = self.bodies.put_bytes(body)
+        entry = {
+            "status": status,
+            "headers": [
+                [name, value]
+                for name, value in headers
+                if name.lower() not in _DROPPED_HEADERS
+            ],
+            "body": digest,
+        }
+        with self._lock:
+            existing = self._entries.get(key)
+            # A retried request keeps its successful response over a later error.
+            if existing and existing["status"] < 400 <= status:
+                return
+            self._entries[key] = entry
+
+    def save(self) -> None:
+        with self._lock:
+            snapshot = dict(self._entries)
+        self.root.mkdir(parents=True, exist_ok=True)
+        index_path = self.root / FIXTURE_INDEX_NAME
+        temp_path = index_path.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            json.dump(snapshot, handle, indent=1, sort_keys=True)
+        temp_path.replace(index_path)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        index_path = self.root / FIXTURE_INDEX_NAME
+        if not index_path.exists():
+            return {}
+        with index_path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Pass requests through to ``inner`` and save every response to a fixture store."""
+
+    def __init__(self, root: Path, inner: Optional[httpx.BaseTransport] = None) -> None:
+        self.store = FixtureStore(root)
+        self.inner = inner or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.inner.handle_request(request)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        self.store.put(
+            fixture_key(request.method, str(request.url)),
+            status=response.status_code,
+            headers=list(response.headers.items()),
+            body=body,
+        )
+        return httpx.Response(
+            response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            ],
+            content=body,
+            request=request,
+        )
+
+    def close(self) -> None:
+        self.inner.close()
+        self.store.save()
+        LOGGER.info("Recorded %s responses to %s", len(self.store.keys()), self.store.root)
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Answer requests from a fixture store without touching the network.
+
+    Requests that were never recorded get an empty 404 so the scraper follows
+    its normal not-found path; they are counted in ``misses``.
+    """
+
+    def __init__(self, root: Path) -> None:
+        if not (root / FIXTURE_INDEX_NAME).exists():
+            raise FileNotFoundError(f"No recorded fixtures in {root}")
+        self.store = FixtureStore(root)
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = fixture_key(request.method, str(request.url))
+        recorded = self.store.get(key)
+        if recorded is None:
+            with self._lock:
+                self.misses += 1
+            LOGGER.warning("No recorded response for %s", key)
+            return httpx.Response(404, content=b"", request=request)
+        entry, body = recorded
+        return httpx.Response(
+            entry["status"],
+            headers=[tuple(header) for header in entry["headers"]],
+            content=body,
+            request=request,
+        )
+
+
+def build_fixture_transport(
+    *,
+    record_dir: Optional[Path] = None,
+    replay_dir: Optional[Path] = None,
+) -> Optional[httpx.BaseTransport]:
+    """Return the transport for the requested fixture mode, or None for live HTTP."""
+
+    if record_dir and replay_dir:
+        raise ValueError("Cannot record and replay fixtures in the same run")
+    if replay_dir:
+        return ReplayTransport(replay_dir)
+    if record_dir:
+        return RecordingTransport(record_dir)
+    return None
@@ -0,0 +1,71 @@
+"""Compressed per-run archive of raw SAM.gov API payloads."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional
+
+
+LOGGER = logging.getLogger(__name__)
+
+ARCHIVE_DIR_NAME = "archive"
+ARCHIVE_GLOB = "payloads-*.jsonl.gz"
+
+
+def archive_paths(root: Path) -> List[Path]:
+    """Return a run directory's payload archives, oldest first."""
+
+    return sorted((root / ARCHIVE_DIR_NAME).glob(ARCHIVE_GLOB))
+
+
+def iter_archive_lines(paths: Iterable[Path]) -> Iterator[str]:
+    """Yield the JSON lines of each archive in order.
+
+    Archives from interrupted runs may end in a truncated gzip stream; the
+    complete lines before the damage are still returned.
+    """
+
+    for path in paths:
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    if line.endswith("\n"):
+                        yield line
+        except (EOFError, OSError, zlib.error) as exc:
+            LOGGER.warning("Stopped reading truncated archive %s: %s", path, exc)
+
+
+class PayloadArchive:
+    """Append-only gzip JSONL file holding one run's API payloads.
+
+    The file is opened on the first append and every record is sync-flushed,
+    so an interrupted run leaves all finished records readable.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._handle: Optional[IO[bytes]] = None
+        self.records = 0
+
+    def append(self, record: Dict[str, Any]) -> None:
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._handle is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._handle = gzip.open(self.path, "ab")
+            self._handle.write(line)
+            self._handle.flush(zlib.Z_SYNC_FLUSH)
+            self.records += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+                LOGGER.info("Archived %s payload(s) to %s", self.records, self.path)
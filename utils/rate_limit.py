@@ -0,0 +1,318 @@
+"""Adaptive per-host rate limiting and retry policy for SAM.gov requests."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+import httpx
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from utils.http_client import IncompleteDownloadError
+
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+TRANSIENT_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+MAX_RETRY_AFTER_SECONDS = 300.0
+# Transport errors caused by the request itself rather than the network.
+PERMANENT_TRANSPORT_ERRORS = (httpx.UnsupportedProtocol, httpx.LocalProtocolError)
+
+
+class TransientRequestError(Exception):
+    """A request failure worth retrying (throttling, 5xx or a network error)."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        response: Any = None,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        self.response = response
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        seconds = (moment - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+@dataclass
+class RequestStats:
+    """Thread-safe counters describing how much a run was throttled."""
+
+    requests: int = 0
+    retries: int = 0
+    throttled_responses: int = 0
+    transient_errors: int = 0
+    rate_limit_wait_seconds: float = 0.0
+    backoff_seconds: float = 0.0
+    bytes_received: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **increments: float) -> None:
+        with self._lock:
+            for name, amount in increments.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled_responses": self.throttled_responses,
+                "transient_errors": self.transient_errors,
+                "rate_limit_wait_seconds": round(self.rate_limit_wait_seconds, 3),
+                "backoff_seconds": round(self.backoff_seconds, 3),
+                "bytes_received": self.bytes_received,
+                "throttled_seconds": round(
+                    self.rate_limit_wait_seconds + self.backoff_seconds, 3
+                ),
+            }
+
+
+# Extra stats objects that requests made in the current context also count
+# into; see track_requests.
+_SCOPED_STATS: ContextVar[Tuple[RequestStats, ...]] = ContextVar(
+    "scoped_request_stats", default=()
+)
+
+
+@contextmanager
+def track_requests(stats: RequestStats) -> Iterator[RequestStats]:
+    """Count requests sent in this context into ``stats`` as well.
+
+    Work handed to other threads is only included when it runs in a copy of
+    this context (``contextvars.copy_context().run``).
+    """
+
+    token = _SCOPED_STATS.set(_SCOPED_STATS.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _SCOPED_STATS.reset(token)
+
+
+@dataclass
+class _Bucket:
+    rate: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+
+
+class AdaptiveRateLimiter:
+    """Token bucket per host whose refill rate follows AIMD.
+
+    Each successful response adds ``increase`` requests/second to the host's
+    rate (up to ``max_rate``); each throttling response multiplies it by
+    ``decrease`` (down to ``min_rate``) and, when the server sent Retry-After,
+    pauses the host until that time.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 4.0,
+        min_rate: float = 0.25,
+        max_rate: float = 20.0,
+        burst: float = 4.0,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ) -> None:
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, rate)
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _Bucket] = {}
+
+    def acquire(self, host: str) -> float:
+        """Block until a request to ``host`` may be sent; return seconds waited."""
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                bucket = self._bucket(host)
+                now = time.monotonic()
+                bucket.tokens = min(
+                    self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate
+                )
+                bucket.updated = now
+                if now >= bucket.blocked_until and bucket.tokens >= 1.0:
+                    bucket.tokens -= 1.0
+                    return waited
+                delay = max(
+                    bucket.blocked_until - now, (1.0 - bucket.tokens) / bucket.rate
+                )
+            time.sleep(delay)
+            waited += delay
+
+    def on_success(self, host: str) -> None:
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def on_throttle(self, host: str, retry_after: Optional[float]) -> None:
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+            bucket.tokens = 0.0
+            if retry_after:
+                bucket.blocked_until = max(
+                    bucket.blocked_until, time.monotonic() + retry_after
+                )
+            LOGGER.info("Throttled by %s; rate now %.2f req/s", host, bucket.rate)
+
+    def current_rates(self) -> Dict[str, float]:
+        with self._lock:
+            return {host: round(bucket.rate, 3) for host, bucket in self._buckets.items()}
+
+    def _bucket(self, host: str) -> _Bucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = _Bucket(rate=self.initial_rate, tokens=1.0, updated=time.monotonic())
+            self._buckets[host] = bucket
+        return bucket
+
+
+class RequestPolicy:
+    """Send requests through the rate limiter, retrying transient failures.
+
+    ``send`` must return a response exposing ``status`` and ``headers`` or raise.
+    Responses with a permanent status (e.g. 404) are returned unchanged for the
+    caller to handle; transient statuses, network errors and truncated
+    downloads are retried with jittered exponential backoff, honouring
+    Retry-After when present. Any other exception (a bad URL, a full disk) is
+    re-raised at once. After the final attempt the last response is returned,
+    or the last error re-raised.
+    """
+
+    def __init__(
+        self,
+        *,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        max_attempts: int = 5,
+        stats: Optional[RequestStats] = None,
+    ) -> None:
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.max_attempts = max(1, max_attempts)
+        self.stats = stats or RequestStats()
+        self._backoff = wait_exponential_jitter(initial=1, max=30)
+
+    def execute(self, host: str, send: Callable[[], T], *, label: str) -> T:
+        retrying = Retrying(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=self._wait,
+            retry=retry_if_exception_type(TransientRequestError),
+            before_sleep=lambda state: self._before_sleep(state, label),
+            reraise=True,
+        )
+        try:
+            for attempt in retrying:
+                with attempt:
+                    return self._attempt(host, send)
+        except TransientRequestError as exc:
+            if exc.response is not None:
+                return exc.response
+            raise exc.__cause__ or exc
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def record(self, **increments: float) -> None:
+        """Add to the run-wide stats and any stats tracked in this context."""
+
+        self.stats.add(**increments)
+        for scoped in _SCOPED_STATS.get():
+            scoped.add(**increments)
+
+    def _attempt(self, host: str, send: Callable[[], T]) -> T:
+        waited = self.limiter.acquire(host)
+        self.record(requests=1, rate_limit_wait_seconds=waited)
+        try:
+            response = send()
+        except (httpx.TransportError, IncompleteDownloadError) as exc:
+            if isinstance(exc, PERMANENT_TRANSPORT_ERRORS):
+                raise
+            self._on_transient(host, None, None)
+            raise TransientRequestError(f"{type(exc).__name__}: {exc}") from exc
+
+        status = getattr(response, "status", 200)
+        if status in TRANSIENT_STATUS_CODES:
+            headers = getattr(response, "headers", None) or {}
+            retry_after = parse_retry_after(
+                headers.get("retry-after") or headers.get("Retry-After")
+            )
+            self._on_transient(host, status, retry_after)
+            raise TransientRequestError(
+                f"status {status}",
+                status=status,
+                retry_after=retry_after,
+                response=response,
+            )
+
+        self.limiter.on_success(host)
+        return response
+
+    def _on_transient(
+        self, host: str, status: Optional[int], retry_after: Optional[float]
+    ) -> None:
+        if status in THROTTLE_STATUS_CODES:
+            self.record(throttled_responses=1)
+            self.limiter.on_throttle(host, retry_after)
+        else:
+            self.record(transient_errors=1)
+
+    def _wait(self, state: RetryCallState) -> float:
+        exc = state.outcome.exception() if state.outcome else None
+        if isinstance(exc, TransientRequestError) and exc.retry_after is not None:
+            return exc.retry_after
+        return self._backoff(state)
+
+    def _before_sleep(self, state: RetryCallState, label: str) -> None:
+        delay = state.next_action.sleep if state.next_action else 0.0
+        self.record(retries=1, backoff_seconds=delay)
+        exc = state.outcome.exception() if state.outcome else None
+        LOGGER.info(
+            "Retrying %s in %.1fs after %s (attempt %s/%s)",
+            label,
+            delay,
+            exc,
+            state.attempt_number,
+            self.max_attempts,
+        )
@@ -0,0 +1,126 @@
+"""Size-capped on-disk cache of text extracted from attachments."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from utils.text_extraction import EXTRACTOR_VERSION, ExtractedDocument
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+ENTRY_SUFFIX = ".json.gz"
+
+
+class ExtractedTextCache:
+    """Normalized text and page offsets keyed by file SHA-256 and extractor version.
+
+    Entries are gzip-compressed JSON under ``root/<digest[:2]>/``. A hit
+    refreshes the entry's modification time, and once the cache grows past
+    ``max_bytes`` the least recently used entries are removed.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def get(self, digest: str, path: Path) -> Optional[ExtractedDocument]:
+        entry_path = self._entry_path(digest)
+        try:
+            with gzip.open(entry_path, "rt", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            os.utime(entry_path)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable text cache entry %s: %s", entry_path, exc)
+            entry_path.unlink(missing_ok=True)
+            self._count(hit=False)
+            return None
+        self._count(hit=True)
+        return ExtractedDocument(
+            path=path,
+            text=payload["text"],
+            extension=payload["extension"],
+            page_offsets=payload["page_offsets"],
+        )
+
+    def put(self, digest: str, document: ExtractedDocument) -> None:
+        entry_path = self._entry_path(digest)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "text": document.text,
+            "extension": document.extension,
+            "page_offsets": document.page_offsets,
+        }
+        descriptor, temp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb"
+            ) as handle:
+                handle.write(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+            os.replace(temp_name, entry_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += entry_path.stat().st_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}-v{EXTRACTOR_VERSION}{ENTRY_SUFFIX}"
+
+    def _count(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob(f"*/*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is 90% of its cap."""
+
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        if removed:
+            LOGGER.info("Evicted %s text cache entry(ies) to stay under %s bytes", removed, self.max_bytes)
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 import docx2txt
 from pypdf import PdfReader
@@ -16,6 +16,12 @@ LOGGER = logging.getLogger(__name__)
 
 SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt"}
 
+# Bump whenever extraction or normalization output changes so cached text
+# produced by older code is no longer used.
+EXTRACTOR_VERSION = "1"
+
+_WHITESPACE_RULES = ((re.compile(r"[\t\r]+"), " "), (re.compile(r"\n{2,}"), "\n\n"))
+
 
 class UnsupportedFileTypeError(Exception):
     """Raised when a requested file type is not supported."""
@@ -26,6 +32,9 @@ class ExtractedDocument:
     path: Path
     text: str
     extension: str
+    # Offset in ``text`` where each page starts; a single entry for formats
+    # without pages.
+    page_offsets: List[int] = field(default_factory=lambda: [0])
 
 
 def extract_text(path: Path) -> ExtractedDocument:
@@ -35,14 +44,19 @@ def extract_text(path: Path) -> ExtractedDocument:
         raise UnsupportedFileTypeError(f"Unsupported file extension: {extension}")
 
     if extension == ".pdf":
-        text = _extract_pdf(path)
+        pages = _extract_pdf(path)
     elif extension == ".docx":
-        text = _extract_docx(path)
+        pages = [_extract_docx(path)]
     else:
-        text = _extract_txt(path)
+        pages = [_extract_txt(path)]
 
-    normalized = _normalize_whitespace(text)
-    return ExtractedDocument(path=path, text=normalized, extension=extension)
+    starts = [0]
+    for page in pages[:-1]:
+        starts.append(starts[-1] + len(page) + 1)
+    normalized, page_offsets = _normalize_whitespace("\n".join(pages), starts)
+    return ExtractedDocument(
+        path=path, text=normalized, extension=extension, page_offsets=page_offsets
+    )
 
 
 def chunk_text(text: str, *, chunk_size: int = 2000, overlap: int = 200) -> List[str]:
@@ -67,7 +81,7 @@ def chunk_text(text: str, *, chunk_size: int = 2000, overlap: int = 200) -> List
     return chunks
 
 
-def _extract_pdf(path: Path) -> str:
+def _extract_pdf(path: Path) -> List[str]:
     reader = PdfReader(str(path))
     pages = []
     for index, page in enumerate(reader.pages):
@@ -75,7 +89,8 @@ def _extract_pdf(path: Path) -> str:
             pages.append(page.extract_text() or "")
         except Exception as exc:  # pylint: disable=broad-except
             LOGGER.warning("Failed to extract text from %s page %s: %s", path, index, exc)
-    return "\n".join(pages)
+            pages.append("")
+    return pages or [""]
 
 
 def _extract_docx(path: Path) -> str:
@@ -90,8 +105,29 @@ def _extract_txt(path: Path) -> str:
     return path.read_text(encoding="utf-8", errors="ignore")
 
 
-def _normalize_whitespace(text: str) -> str:
-    collapsed = re.sub(r"[\t\r]+", " ", text)
-    collapsed = re.sub(r"\n{2,}", "\n\n", collapsed)
-    return collapsed.strip()
-
+def _normalize_whitespace(text: str, offsets: List[int]) -> Tuple[str, List[int]]:
+    """Collapse whitespace runs and move the ascending ``offsets`` to match."""
+
+    for pattern, replacement in _WHITESPACE_RULES:
+        pieces: List[str] = []
+        shifted: List[int] = []
+        cursor = 0
+        delta = 0
+        for match in pattern.finditer(text):
+            while len(shifted) < len(offsets) and offsets[len(shifted)] <= match.start():
+                shifted.append(offsets[len(shifted)] + delta)
+            while len(shifted) < len(offsets) and offsets[len(shifted)] < match.end():
+                # Inside a collapsed run: point just past the replacement.
+                shifted.append(match.start() + delta + len(replacement))
+            pieces.append(text[cursor : match.start()])
+            pieces.append(replacement)
+            cursor = match.end()
+            delta += len(replacement) - (match.end() - match.start())
+        shifted.extend(offset + delta for offset in offsets[len(shifted) :])
+        pieces.append(text[cursor:])
+        text = "".join(pieces)
+        offsets = shifted
+
+    stripped = text.strip()
+    leading = len(text) - len(text.lstrip())
+    return stripped, [min(max(offset - leading, 0), len(stripped)) for offset in offsets]